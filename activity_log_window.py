@@ -5,6 +5,8 @@ A dedicated window showing Calvelli's activities and progress
 
 import pygame
 import os
+import time
+from themed_windows import load_image, render_text
 
 class ActivityLogWindow:
     """Window displaying activity log and progress bar"""
@@ -28,23 +30,16 @@ class ActivityLogWindow:
         # Load window assets
         self.titlebar_height = 40
         try:
-            titlebar_img = pygame.image.load(
-                os.path.join(assets_path, "ui", "window_titlebar_background_800x40.png")
-            ).convert_alpha()
-            if titlebar_img.get_width() != self.width:
-                self.titlebar_bg = pygame.transform.scale(titlebar_img, (self.width, 40))
-            else:
-                self.titlebar_bg = titlebar_img
+            titlebar_path = os.path.join(assets_path, "ui", "window_titlebar_background_800x40.png")
+            self.titlebar_bg = load_image(titlebar_path, alpha=True)
+            if self.titlebar_bg.get_width() != self.width:
+                self.titlebar_bg = load_image(titlebar_path, (self.width, 40), alpha=True)
         except:
-            self.titlebar_bg = pygame.Surface((self.width, 40))
+            self.titlebar_bg = pygame.Surface((self.width, 40)).convert()
             self.titlebar_bg.fill((200, 200, 200))
         
-        self.close_icon = pygame.image.load(
-            os.path.join(assets_path, "ui", "icon_close_x_20x20.png")
-        ).convert_alpha()
-        self.minimize_icon = pygame.image.load(
-            os.path.join(assets_path, "ui", "icon_minimize_20x20.png")
-        ).convert_alpha()
+        self.close_icon = load_image(os.path.join(assets_path, "ui", "icon_close_x_20x20.png"), alpha=True)
+        self.minimize_icon = load_image(os.path.join(assets_path, "ui", "icon_minimize_20x20.png"), alpha=True)
         
         # Button positions
         self.close_button_rect = pygame.Rect(
@@ -65,7 +60,7 @@ class ActivityLogWindow:
         )
         
         # Window background - different color (dark blue-gray)
-        self.background_surface = pygame.Surface((self.width, self.height))
+        self.background_surface = pygame.Surface((self.width, self.height)).convert()
         self.background_surface.fill((40, 50, 70))
         
         # Progress bar assets
@@ -77,16 +72,12 @@ class ActivityLogWindow:
         """Load progress bar assets"""
         try:
             ui_path = os.path.join(self.assets_path, "ui")
-            frame_img = pygame.image.load(
-                os.path.join(ui_path, "progress_bar_frame_600x30.png")
-            ).convert_alpha()
-            fill_img = pygame.image.load(
-                os.path.join(ui_path, "progress_bar_fill_full_600x30.png")
-            ).convert_alpha()
-            # Scale to fit window width
+            # Scaled to fit window width
             bar_width = self.width - 40
-            self.progress_bar_frame = pygame.transform.scale(frame_img, (bar_width, 30))
-            self.progress_bar_fill = pygame.transform.scale(fill_img, (bar_width, 30))
+            self.progress_bar_frame = load_image(os.path.join(ui_path, "progress_bar_frame_600x30.png"),
+                                                 (bar_width, 30), alpha=True)
+            self.progress_bar_fill = load_image(os.path.join(ui_path, "progress_bar_fill_full_600x30.png"),
+                                                (bar_width, 30), alpha=True)
         except:
             # Fallback: create simple progress bars
             bar_width = self.width - 40
@@ -97,7 +88,6 @@ class ActivityLogWindow:
     
     def add_activity(self, message, progress_increase=None):
         """Add a new activity to the log"""
-        import time
         timestamp = time.time()
         self.activities.append((message, timestamp, progress_increase))
         # Keep only the most recent activities
@@ -105,23 +95,11 @@ class ActivityLogWindow:
             self.activities.pop(0)
     
     def _update_button_positions(self):
-        """Update button positions when window is moved"""
-        self.close_button_rect = pygame.Rect(
-            self.position[0] + self.width - 25,
-            self.position[1] + 10,
-            20, 20
-        )
-        self.minimize_button_rect = pygame.Rect(
-            self.position[0] + self.width - 50,
-            self.position[1] + 10,
-            20, 20
-        )
-        self.titlebar_rect = pygame.Rect(
-            self.position[0],
-            self.position[1],
-            self.width,
-            self.titlebar_height
-        )
+        """Update button positions when window is moved (runs on every drag event, so the Rects are moved in place)"""
+        x, y = self.position
+        self.close_button_rect.topleft = (x + self.width - 25, y + 10)
+        self.minimize_button_rect.topleft = (x + self.width - 50, y + 10)
+        self.titlebar_rect.update(x, y, self.width, self.titlebar_height)
     
     def handle_click(self, pos):
         """Handle click on window"""
@@ -151,35 +129,37 @@ class ActivityLogWindow:
     
     def contains_point(self, pos):
         """Check if point is within window"""
-        window_rect = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
-        return window_rect.collidepoint(pos)
+        px, py = pos
+        x, y = self.position
+        return x <= px < x + self.width and y <= py < y + self.height
     
     def render(self, screen, progress):
         """Render the activity log window"""
+        # Window origin, bound once since this is drawn every frame
+        x, y = self.position
+        
         # Draw window background
-        screen.blit(self.background_surface, self.position)
+        screen.blit(self.background_surface, (x, y))
         
         # Draw titlebar
-        screen.blit(self.titlebar_bg, (self.position[0], self.position[1]))
-        font = pygame.font.Font(None, 20)
-        title_text = font.render("Activity Log", True, (0, 0, 0))  # Black text
-        text_y = self.position[1] + (self.titlebar_height - title_text.get_height()) // 2
-        screen.blit(title_text, (self.position[0] + 10, text_y))
+        screen.blit(self.titlebar_bg, (x, y))
+        title_text = render_text(20, "Activity Log", (0, 0, 0))  # Black text
+        text_y = y + (self.titlebar_height - title_text.get_height()) // 2
+        screen.blit(title_text, (x + 10, text_y))
         screen.blit(self.close_icon, self.close_button_rect.topleft)
         screen.blit(self.minimize_icon, self.minimize_button_rect.topleft)
         
-        content_y = self.position[1] + self.titlebar_height + 20
+        content_y = y + self.titlebar_height + 20
         
         # Draw progress text above bar (centered, red with black outline)
-        progress_font = pygame.font.Font(None, 24)
         progress_text = f"Fundraising Progress: {progress:.1f}%"
         
         # Create text with outline
-        text_surface = progress_font.render(progress_text, True, (255, 0, 0))  # Red text
-        outline_surface = progress_font.render(progress_text, True, (0, 0, 0))  # Black outline
+        text_surface = render_text(24, progress_text, (255, 0, 0))  # Red text
+        outline_surface = render_text(24, progress_text, (0, 0, 0))  # Black outline
         
         # Calculate centered position
-        bar_x = self.position[0] + 20
+        bar_x = x + 20
         bar_width = self.width - 40
         text_x = bar_x + (bar_width - text_surface.get_width()) // 2
         text_y = content_y - 10  # Move text up a little more
@@ -207,14 +187,15 @@ class ActivityLogWindow:
         
         # Draw activity log
         log_start_y = content_y + 70
-        log_font = pygame.font.Font(None, 18)
         log_area_height = self.height - self.titlebar_height - 120  # Leave space for progress bar
         
         # Draw activities (most recent at top) - larger cards
         y_offset = log_start_y
         card_height = 48  # Slightly taller cards to fit text comfortably
+        card_width = self.width - 20
+        log_bottom = y + self.height - 20
         for i, activity_data in enumerate(reversed(self.activities)):
-            if y_offset > self.position[1] + self.height - 20:
+            if y_offset > log_bottom:
                 break  # Don't draw outside window
             
             # Unpack activity data (handle both old format and new format)
@@ -227,29 +208,25 @@ class ActivityLogWindow:
             # Alternate background for readability (larger cards)
             if i % 2 == 0:
                 pygame.draw.rect(screen, (50, 60, 80),
-                               pygame.Rect(self.position[0] + 10, y_offset - 2, 
-                                         self.width - 20, card_height))
+                               pygame.Rect(x + 10, y_offset - 2, card_width, card_height))
             else:
                 pygame.draw.rect(screen, (45, 55, 75),
-                               pygame.Rect(self.position[0] + 10, y_offset - 2, 
-                                         self.width - 20, card_height))
+                               pygame.Rect(x + 10, y_offset - 2, card_width, card_height))
             
             # Draw activity text (larger font)
-            activity_font = pygame.font.Font(None, 22)
-            text_surface = activity_font.render(message, True, (255, 255, 255))
-            screen.blit(text_surface, (self.position[0] + 15, y_offset + 5))
+            text_surface = render_text(22, message, (255, 255, 255))
+            screen.blit(text_surface, (x + 15, y_offset + 5))
             
             # Draw progress increase if available (on new line)
             if progress_increase is not None and progress_increase > 0:
-                increase_font = pygame.font.Font(None, 18)
-                increase_text = increase_font.render(f"Progress increased: +{progress_increase:.1f}%", True, (100, 255, 100))
-                screen.blit(increase_text, (self.position[0] + 15, y_offset + 25))
+                increase_text = render_text(18, f"Progress increased: +{progress_increase:.1f}%", (100, 255, 100))
+                screen.blit(increase_text, (x + 15, y_offset + 25))
             
             y_offset += card_height + 2
         
         # Draw border
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(x, y, self.width, self.height), 2)
 
     def render_for_startup(self, screen):
         """Simplified render used during startup animations (no progress needed)"""
@@ -6,6 +6,7 @@ Shows random things Calvelli has done, which increase progress
 import pygame
 import random
 from messages_content import CALVELLI_ACTIVITIES
+from themed_windows import render_text
 
 class CalvelliLog:
     """Manages the activity log showing what Calvelli has done"""
@@ -91,8 +92,7 @@ class CalvelliLog:
         log_y = 70
         
         # Create background panel
-        font = pygame.font.Font(None, 28)
-        text_surface = font.render(self.current_log, True, (255, 255, 255))
+        text_surface = render_text(28, self.current_log, (255, 255, 255))
         
         # Panel dimensions
         padding = 15
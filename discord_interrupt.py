@@ -6,6 +6,7 @@ Handles Calvelli's Discord messages that interrupt gameplay
 import pygame
 import random
 import os
+from themed_windows import get_font, load_image, render_text
 
 class DiscordInterrupt:
     """Manages Discord interruptions from Calvelli"""
@@ -185,7 +186,7 @@ class DiscordInterrupt:
         pygame.draw.rect(screen, (100, 100, 100), self.popup_rect, 2)
         
         # Draw message text (centered in popup) - larger font
-        font = pygame.font.Font(None, 32)  # Increased from 24
+        font = get_font(32)  # Increased from 24
         # Wrap text if needed
         words = self.current_message.split(' ')
         lines = []
@@ -206,20 +207,17 @@ class DiscordInterrupt:
         total_height = len(lines) * 35  # Increased spacing
         start_y = self.popup_rect.y + (self.popup_height - total_height) // 2
         for i, line in enumerate(lines):
-            text_surface = font.render(line, True, (255, 255, 255))
+            text_surface = render_text(32, line, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(self.popup_rect.centerx, start_y + i * 35))
             screen.blit(text_surface, text_rect)
         
         # Draw "Message From: Calvelli" label (top left of popup) - larger font
-        name_font = pygame.font.Font(None, 24)  # Increased from 20
-        name_text = name_font.render("Message From: Calvelli", True, (200, 200, 200))
+        name_text = render_text(24, "Message From: Calvelli", (200, 200, 200))  # Increased from 20
         screen.blit(name_text, (self.popup_rect.x + 15, self.popup_rect.y + 10))
         
         # Draw close button (top right of popup)
         ui_path = os.path.join(self.assets_path, "ui")
-        close_icon = pygame.image.load(
-            os.path.join(ui_path, "icon_close_x_20x20.png")
-        ).convert_alpha()
+        close_icon = load_image(os.path.join(ui_path, "icon_close_x_20x20.png"), alpha=True)
         screen.blit(close_icon, self.close_button_rect.topleft)
         
         # Draw Ignore button (big button at bottom)
@@ -230,7 +228,6 @@ class DiscordInterrupt:
             pygame.draw.rect(screen, (150, 150, 150), self.ignore_button_rect, 2)
             
             # Button text
-            button_font = pygame.font.Font(None, 32)
-            ignore_text = button_font.render("Ignore", True, (255, 255, 255))
+            ignore_text = render_text(32, "Ignore", (255, 255, 255))
             text_rect = ignore_text.get_rect(center=self.ignore_button_rect.center)
             screen.blit(ignore_text, text_rect)
@@ -6,6 +6,7 @@ Shows email notifications in the top right that stack and slide up
 import pygame
 import random
 import time
+from themed_windows import get_font, render_text
 
 class EmailNotification:
     """A single email notification"""
@@ -84,13 +85,12 @@ class EmailNotification:
                         pygame.Rect(icon_x, icon_y, icon_size, icon_size), 2)
         
         # Draw "Incoming Mail" text (clear and simple)
-        font_title = pygame.font.Font(None, 24)
-        font_subtitle = pygame.font.Font(None, 18)
+        font_subtitle = get_font(18)
         
         text_x = icon_x + icon_size + padding
         
         # "Incoming Mail" title
-        title_text = font_title.render("Incoming Mail", True, (0, 0, 0))
+        title_text = render_text(24, "Incoming Mail", (0, 0, 0))
         notification.blit(title_text, (text_x, padding))
         
         # Subject (truncate if too long)
@@ -101,7 +101,7 @@ class EmailNotification:
                 subject_display = subject_display[:-1]
             subject_display += "..."
         
-        subject_text = font_subtitle.render(subject_display, True, (100, 100, 100))
+        subject_text = render_text(18, subject_display, (100, 100, 100))
         notification.blit(subject_text, (text_x, padding + 28))
         
         # Draw to screen
@@ -4,7 +4,7 @@ A separate window for displaying full email content
 """
 
 import pygame
-from themed_windows import ThemedWindow
+from themed_windows import ThemedWindow, blit_centered, render_text, wrap_text
 
 class EmailViewWindow(ThemedWindow):
     """Window for displaying full email content"""
@@ -25,23 +25,18 @@ class EmailViewWindow(ThemedWindow):
         self.reply_to_open = None  # Signal to open reply window
         # Track pressed state so action can trigger on mouse release
         self._reply_button_pressed = False
+        # Reply button (top right of the content area) relative to the window
+        self._reply_button_rect = pygame.Rect(self.width - 20 - 100, self.titlebar_height + 20, 100, 30)
+        # Reply shown in the snapshot; ReplyWindow fills it in through the shared email_data
+        self._reply_state = None
         
     def _handle_content_click(self, pos):
         """Handle clicks within the content area"""
-        content_y = self.position[1] + self.titlebar_height
-        content_x = self.position[0]
-        padding = 20
+        self.mark_dirty()
         
         # Check if click is on Reply button (for congratulatory emails)
         if 'responses' in self.email_data:
-            # Calculate Reply button position (top right of content area)
-            reply_button_rect = pygame.Rect(
-                content_x + self.width - padding - 100,
-                content_y + padding,
-                100,
-                30
-            )
-            if reply_button_rect.collidepoint(pos):
+            if self._reply_button_rect.collidepoint(pos[0] - self._x, pos[1] - self._y):
                 # Mark as pressed; actual action happens on mouse release
                 self._reply_button_pressed = True
                 return True
@@ -50,58 +45,53 @@ class EmailViewWindow(ThemedWindow):
     
     def handle_release(self, pos):
         """Handle mouse release - trigger actions after visual feedback"""
+        self.mark_dirty()
         # Let base class handle drag state reset
         super().handle_release(pos)
         
-        content_y = self.position[1] + self.titlebar_height
-        content_x = self.position[0]
-        padding = 20
-        
         # Reply button action on release
         if 'responses' in self.email_data:
-            reply_button_rect = pygame.Rect(
-                content_x + self.width - padding - 100,
-                content_y + padding,
-                100,
-                30
-            )
-            if self._reply_button_pressed and reply_button_rect.collidepoint(pos):
+            if self._reply_button_pressed and self._reply_button_rect.collidepoint(pos[0] - self._x, pos[1] - self._y):
                 # Open reply window with first response as default
                 self.reply_to_open = self.email_data['responses'][0]
         # Reset press state
         self._reply_button_pressed = False
     
     def render(self, screen):
+        reply_state = (self.email_data.get('replied', False), self.email_data.get('reply_text'))
+        if reply_state != self._reply_state:
+            self._reply_state = reply_state
+            self.mark_dirty()
+        self._track_mouse_press()
+        self._render_cached(screen)
+    
+    def _draw_window(self, screen):
         screen.blit(self.background_surface, self.position)
         self.render_titlebar(screen)
         
-        content_y = self.position[1] + self.titlebar_height
-        content_x = self.position[0]
+        content_y = self._y + self.titlebar_height
+        content_x = self._x
         padding = 20
         
         # Email header
-        font_title = pygame.font.Font(None, 24)
-        font_label = pygame.font.Font(None, 16)
-        font_message = pygame.font.Font(None, 18)
-        
         y_offset = padding
         
         # Subject
-        subject_text = font_title.render(self.email_data.get('subject', 'No Subject'), True, (0, 0, 0))
+        subject_text = render_text(24, self.email_data.get('subject', 'No Subject'), (0, 0, 0))
         screen.blit(subject_text, (content_x + padding, content_y + y_offset))
         y_offset += 35
         
         # From
-        from_label = font_label.render("From:", True, (100, 100, 100))
+        from_label = render_text(16, "From:", (100, 100, 100))
         screen.blit(from_label, (content_x + padding, content_y + y_offset))
-        from_text = font_label.render(self.email_data.get('from', 'Unknown'), True, (0, 0, 0))
+        from_text = render_text(16, self.email_data.get('from', 'Unknown'), (0, 0, 0))
         screen.blit(from_text, (content_x + padding + 50, content_y + y_offset))
         y_offset += 25
         
         # Time
-        time_label = font_label.render("Time:", True, (100, 100, 100))
+        time_label = render_text(16, "Time:", (100, 100, 100))
         screen.blit(time_label, (content_x + padding, content_y + y_offset))
-        time_text = font_label.render(self.email_data.get('time', ''), True, (0, 0, 0))
+        time_text = render_text(16, self.email_data.get('time', ''), (0, 0, 0))
         screen.blit(time_text, (content_x + padding + 50, content_y + y_offset))
         y_offset += 30
         
@@ -114,33 +104,18 @@ class EmailViewWindow(ThemedWindow):
         # Email message
         if 'message' in self.email_data:
             # Wrap message text
-            message = self.email_data['message']
-            words = message.split(' ')
-            lines = []
-            current_line = ""
-            max_width = self.width - padding * 2
-            
-            for word in words:
-                test_line = current_line + word + " " if current_line else word + " "
-                if font_message.size(test_line)[0] < max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        lines.append(current_line.strip())
-                    current_line = word + " "
-            if current_line:
-                lines.append(current_line.strip())
+            lines = wrap_text(self.email_data['message'], 18, self.width - padding * 2)
             
             # Draw message lines
             for i, line in enumerate(lines):
                 if content_y + y_offset + i * 22 < content_y + self.height - 200:  # Leave space for reply
-                    line_text = font_message.render(line, True, (0, 0, 0))
+                    line_text = render_text(18, line, (0, 0, 0))
                     screen.blit(line_text, (content_x + padding, content_y + y_offset + i * 22))
             
             y_offset += len(lines) * 22 + 30
         else:
             # Regular email - show placeholder
-            placeholder = font_message.render("Email content not available", True, (150, 150, 150))
+            placeholder = render_text(18, "Email content not available", (150, 150, 150))
             screen.blit(placeholder, (content_x + padding, content_y + y_offset))
             y_offset += 30
         
@@ -154,27 +129,12 @@ class EmailViewWindow(ThemedWindow):
             y_offset += 20
             
             # Reply header
-            reply_label = font_title.render("Your Reply:", True, (0, 120, 212))
+            reply_label = render_text(24, "Your Reply:", (0, 120, 212))
             screen.blit(reply_label, (content_x + padding, content_y + y_offset))
             y_offset += 30
             
             # Reply text (wrapped)
-            reply_text = self.email_data['reply_text']
-            reply_words = reply_text.split(' ')
-            reply_lines = []
-            current_line = ""
-            max_width = self.width - padding * 2
-            
-            for word in reply_words:
-                test_line = current_line + word + " " if current_line else word + " "
-                if font_message.size(test_line)[0] < max_width:
-                    current_line = test_line
-                else:
-                    if current_line:
-                        reply_lines.append(current_line.strip())
-                    current_line = word + " "
-            if current_line:
-                reply_lines.append(current_line.strip())
+            reply_lines = wrap_text(self.email_data['reply_text'], 18, self.width - padding * 2)
             
             # Draw reply lines with different background
             reply_bg_rect = pygame.Rect(
@@ -188,22 +148,17 @@ class EmailViewWindow(ThemedWindow):
             
             for i, line in enumerate(reply_lines):
                 if content_y + y_offset + i * 22 < content_y + self.height - 100:
-                    line_text = font_message.render(line, True, (0, 0, 0))
+                    line_text = render_text(18, line, (0, 0, 0))
                     screen.blit(line_text, (content_x + padding, content_y + y_offset + i * 22))
             
             y_offset += len(reply_lines) * 22 + 10
         
         # Reply button (for emails with responses)
         if 'responses' in self.email_data and len(self.email_data['responses']) > 0:
-            reply_button_rect = pygame.Rect(
-                content_x + self.width - padding - 100,
-                content_y + padding,
-                100,
-                30
-            )
+            reply_button_rect = self._reply_button_rect.move(self._x, self._y)
             
             # Button background with simple click feedback (darker when pressed)
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self._mouse_pos()
             mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
             if reply_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
                 bg_color = (0, 90, 170)
@@ -214,11 +169,9 @@ class EmailViewWindow(ThemedWindow):
             pygame.draw.rect(screen, (0, 100, 180), reply_button_rect, 1)
             
             # Reply text
-            reply_font = pygame.font.Font(None, 16)
-            reply_text = reply_font.render("Reply", True, (255, 255, 255))
-            text_rect = reply_text.get_rect(center=reply_button_rect.center)
-            screen.blit(reply_text, text_rect)
+            reply_text = render_text(16, "Reply", (255, 255, 255))
+            blit_centered(screen, reply_text, reply_button_rect.center)
         
         # Window border
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(self._x, self._y, self.width, self.height), 2)
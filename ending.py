@@ -6,6 +6,7 @@ Displays stats showing the player did nothing and Calvelli did all the work
 import pygame
 import random
 import math
+from themed_windows import render_text
 
 class EndingScreen:
     """The ending screen that reveals the secret"""
@@ -189,12 +190,12 @@ class EndingScreen:
             )
         
         # Draw title with scale animation
-        title_font = pygame.font.Font(None, int(72 * self.title_scale))
+        title_size = int(72 * self.title_scale)
         title_text = "CONFERENCE FUNDRAISING COMPLETE!"
         
         # Create title with outline
-        title_surface = title_font.render(title_text, True, self.title_color)
-        title_outline = title_font.render(title_text, True, (0, 0, 0))
+        title_surface = render_text(title_size, title_text, self.title_color)
+        title_outline = render_text(title_size, title_text, (0, 0, 0))
         
         title_rect = title_surface.get_rect(center=(960, 120))
         
@@ -225,15 +226,14 @@ class EndingScreen:
             self.screen.blit(panel_surface, (panel_x, panel_y))
             
             # Stats header
-            stats_font = pygame.font.Font(None, 56)
             header_text = "Your Statistics"
-            header_surface = stats_font.render(header_text, True, self.text_color)
+            # Cached text is shared, so fade a copy
+            header_surface = render_text(56, header_text, self.text_color).copy()
             header_surface.set_alpha(self.stats_alpha)
             header_rect = header_surface.get_rect(center=(960, panel_y + 50))
             self.screen.blit(header_surface, header_rect)
             
             # Individual stats
-            small_font = pygame.font.Font(None, 40)
             stats_y = panel_y + 120
             line_height = 50
             
@@ -244,7 +244,7 @@ class EndingScreen:
             ]
             
             for stat in stats:
-                stat_surface = small_font.render(stat, True, self.stats_color)
+                stat_surface = render_text(40, stat, self.stats_color).copy()
                 stat_surface.set_alpha(self.stats_alpha)
                 stat_rect = stat_surface.get_rect(center=(960, stats_y))
                 self.screen.blit(stat_surface, stat_rect)
@@ -254,14 +254,13 @@ class EndingScreen:
             
             # Calvelli's work (highlighted)
             calvelli_text = f"Calvelli's Work: {self.stats['calvelli_work_done']:.1f}%"
-            calvelli_surface = stats_font.render(calvelli_text, True, self.secret_color)
+            calvelli_surface = render_text(56, calvelli_text, self.secret_color).copy()
             calvelli_surface.set_alpha(self.stats_alpha)
             calvelli_rect = calvelli_surface.get_rect(center=(960, stats_y))
             self.screen.blit(calvelli_surface, calvelli_rect)
         
         # The secret reveal (with fade-in)
         if self.secret_alpha > 0:
-            secret_font = pygame.font.Font(None, 44)
             secret_lines = [
                 "THE SECRET:",
                 "",
@@ -275,23 +274,21 @@ class EndingScreen:
             secret_y = 700
             for i, line in enumerate(secret_lines):
                 if line:
-                    secret_surface = secret_font.render(line, True, self.secret_color)
+                    secret_surface = render_text(44, line, self.secret_color).copy()
                     secret_surface.set_alpha(self.secret_alpha)
                     secret_rect = secret_surface.get_rect(center=(960, secret_y + i * 50))
                     self.screen.blit(secret_surface, secret_rect)
         
         # Exit instruction (always visible)
-        exit_font = pygame.font.Font(None, 32)
         exit_text = "Press ESC to exit"
-        exit_surface = exit_font.render(exit_text, True, (200, 200, 200))
+        exit_surface = render_text(32, exit_text, (200, 200, 200))
         exit_rect = exit_surface.get_rect(center=(960, 1050))
         self.screen.blit(exit_surface, exit_rect)
         
         # Cheering strip at bottom (ASCII-only to avoid missing glyphs)
-        cheer_font = pygame.font.Font(None, 48)
         cheer_patterns = ["* * * * *", ">>> >>> >>>", "YAY YAY YAY", "CLAP CLAP CLAP"]
         cheer_index = (self.animation_time // 30) % len(cheer_patterns)
         cheer_text = cheer_patterns[cheer_index]
-        cheer_surface = cheer_font.render(cheer_text, True, (255, 255, 0))
+        cheer_surface = render_text(48, cheer_text, (255, 255, 0))
         cheer_rect = cheer_surface.get_rect(center=(960, 1000))
         self.screen.blit(cheer_surface, cheer_rect)
@@ -6,6 +6,7 @@ Handles FTL and Zomboid notifications with clickable yellow circles
 import pygame
 import random
 import time
+from themed_windows import render_text
 
 class GameNotification:
     """A notification for FTL or Zomboid that requires clicking circles"""
@@ -154,22 +155,21 @@ class GameNotification:
         pygame.draw.rect(screen, (200, 120, 0), instruction_box, 2)  # Darker orange border
         
         # Draw instruction text
-        font_instruction = pygame.font.Font(None, 20)
-        font_play = pygame.font.Font(None, 26)  # Larger font for "Play [Game]"
         if self.completion_message:
-            instruction_text = font_instruction.render(self.completion_message, True, (0, 0, 0))
+            # Copy the shared cached text so the fade alpha doesn't leak to other users
+            instruction_text = render_text(20, self.completion_message, (0, 0, 0)).copy()
             instruction_text.set_alpha(self.fade_alpha)
             text_rect = instruction_text.get_rect(center=instruction_box.center)
             screen.blit(instruction_text, text_rect)
         else:
             # Draw "Play [Game]" on first line (larger font)
             game_name = "FTL" if self.game_type == "ftl" else "Zomboid"
-            play_text = font_play.render(f"Play {game_name}", True, (0, 0, 0))
+            play_text = render_text(26, f"Play {game_name}", (0, 0, 0))
             play_rect = play_text.get_rect(center=(instruction_box.centerx, instruction_box.y + 15))
             screen.blit(play_text, play_rect)
             
             # Draw "Click the yellow circles!" on second line
-            circles_text = font_instruction.render("Click the yellow circles!", True, (0, 0, 0))
+            circles_text = render_text(20, "Click the yellow circles!", (0, 0, 0))
             circles_rect = circles_text.get_rect(center=(instruction_box.centerx, instruction_box.y + 32))
             screen.blit(circles_text, circles_rect)
         
@@ -10,6 +10,7 @@ import os
 import argparse
 import math
 import random
+import time
 from themed_windows import (FTLWindow, ZomboidWindow, InventoryWindow, 
                            OutlookWindow, MessagesWindow, SlackWindow, DiscordWindow)
 from email_view_window import EmailViewWindow
@@ -30,6 +31,7 @@ from game_notifications import GameNotificationSystem
 from phone_call import PhoneCallSystem
 from start_screen import StartScreen
 from startup_animation import StartupAnimation
+from messages_content import CONGRATULATORY_EMAILS
 
 # Initialize Pygame
 pygame.init()
@@ -252,7 +254,6 @@ class Game:
                     if self.start_screen.handle_keypress(event.key):
                         self.showing_start_screen = False
                         self.showing_startup_animation = True
-                        import time
                         # Include activity log window in startup animations
                         windows_for_animation = [self.activity_log_window] + self.menus
                         self.startup_animation = StartupAnimation(self.screen, windows_for_animation)
@@ -362,7 +363,7 @@ class Game:
                     for i, email in enumerate(outlook_window.emails):
                         if (email.get('type') == 'congratulatory' and 
                             email.get('subject') == clicked_email_data['subject']):
-                            outlook_window.emails[i]['read'] = True
+                            outlook_window.mark_read(outlook_window.emails[i])
                             outlook_window.emails[i]['blinking'] = False  # Stop blinking
                             # Set highlighted email (temporary highlight)
                             outlook_window.highlighted_email_index = i
@@ -432,12 +433,11 @@ class Game:
                     
                     if existing_window:
                         # Center the existing window instead of opening a new one
-                        existing_window.position[0] = (SCREEN_WIDTH - existing_window.width) // 2
-                        existing_window.position[1] = (SCREEN_HEIGHT - existing_window.height) // 2
+                        center_x = (SCREEN_WIDTH - existing_window.width) // 2
+                        center_y = (SCREEN_HEIGHT - existing_window.height) // 2
                         # Ensure it is not hidden behind the activity log window
                         min_x = self.activity_log_window.position[0] + self.activity_log_window.width + 20
-                        if existing_window.position[0] < min_x:
-                            existing_window.position[0] = min_x
+                        existing_window.position = (max(center_x, min_x), center_y)
                         # Bring to front
                         max_z = max([m.z_index for m in self.menus] + [self.activity_log_window.z_index], default=0)
                         existing_window.z_index = max_z + 1
@@ -469,7 +469,6 @@ class Game:
             self.activity_log_window.position[0] + self.activity_log_window.width // 2,
             self.activity_log_window.position[1] + self.activity_log_window.titlebar_height + 35
         )
-        import time
         self.progress_popup_system.check_progress_increase(self.game_state.progress, progress_bar_center)
     
     def _handle_release(self, pos):
@@ -504,12 +503,7 @@ class Game:
     
     def update(self):
         """Update game state"""
-        # Handle startup animation
-        if self.showing_startup_animation and self.startup_animation:
-            dt = self.clock.get_time() / 1000.0  # Convert to seconds
-            if self.startup_animation.update(dt):
-                self.showing_startup_animation = False
-                self.game_started = True
+        # Startup animation is advanced from render() (see StartupAnimation.step_and_render)
         
         # Don't update game if not started
         if not self.game_started:
@@ -540,13 +534,11 @@ class Game:
                     self.activity_log_window.position[0] + self.activity_log_window.width // 2,
                     self.activity_log_window.position[1] + self.activity_log_window.titlebar_height + 35
                 )
-                import time
                 current_time = time.time()
                 self.progress_popup_system.check_progress_increase(self.game_state.progress, progress_bar_center)
                 
                 # Trigger Slack, Messages, or Discord notification (random choice)
                 # First add message to window, then create notification
-                import random
                 choice = random.random()
                 if choice < 0.33:
                     # Add message to Slack window first
@@ -613,7 +605,6 @@ class Game:
         self.messages_notifications.update()
         
         # Check for milestone notifications
-        import time
         current_time = time.time()
         self.milestone_notifications.check_milestones(self.game_state.progress)
         self.milestone_notifications.update(current_time)
@@ -742,10 +733,6 @@ class Game:
     
     def _trigger_congratulatory_email(self):
         """Trigger a congratulatory email notification and add to Outlook"""
-        from messages_content import CONGRATULATORY_EMAILS
-        import random
-        import time
-        
         # Pick a random congratulatory email
         email_template = random.choice(CONGRATULATORY_EMAILS)
         timestamp = time.time()
@@ -761,7 +748,6 @@ class Game:
     def _open_email_window(self, email_data):
         """Open an email in a new window"""
         # Calculate position (slightly offset from center)
-        import random
         x = 400 + random.randint(-100, 100)
         y = 200 + random.randint(-50, 50)
         # Ensure the email window does not appear under the activity log window
@@ -787,7 +773,6 @@ class Game:
     def _open_reply_window(self, email_data, selected_response):
         """Open a reply composition window"""
         # Calculate position (slightly offset from center)
-        import random
         x = 500 + random.randint(-50, 50)
         y = 250 + random.randint(-50, 50)
         
@@ -818,6 +803,24 @@ class Game:
             if 'celebration' in self.sounds:
                 self.sounds['celebration'].play()
     
+    def _visible_menus(self, draw_order):
+        """Return the set of menus that can show on screen
+        
+        A window is skipped when it lies entirely off the screen or entirely inside
+        a single window drawn after it (windows are opaque rectangles).
+        """
+        screen_rect = self.screen.get_rect()
+        log = self.activity_log_window
+        # The activity log is drawn after every menu
+        covers = [pygame.Rect(log.position[0], log.position[1], log.width, log.height)]
+        visible = set()
+        for menu in reversed(draw_order):
+            rect = pygame.Rect(menu.position[0], menu.position[1], menu.width, menu.height)
+            if screen_rect.colliderect(rect) and not any(cover.contains(rect) for cover in covers):
+                visible.add(menu)
+            covers.append(rect)
+        return visible
+    
     def render(self):
         """Render the game"""
         # Show start screen
@@ -826,9 +829,12 @@ class Game:
             pygame.display.flip()
             return
         
-        # Show startup animation
+        # Show startup animation (updated and drawn in a single pass)
         if self.showing_startup_animation and self.startup_animation:
-            self.startup_animation.render(self.background)
+            dt = self.clock.get_time() / 1000.0  # Convert to seconds
+            if self.startup_animation.step_and_render(dt, self.background):
+                self.showing_startup_animation = False
+                self.game_started = True
             pygame.display.flip()
             return
         
@@ -844,8 +850,11 @@ class Game:
                 self.ending_screen.render()
         else:
             # Draw menu windows (including game notification overlays)
-            for menu in sorted(self.menus, key=lambda m: m.z_index):
-                menu.render(self.screen)
+            draw_order = sorted(self.menus, key=lambda m: m.z_index)
+            visible_menus = self._visible_menus(draw_order)
+            for menu in draw_order:
+                if menu in visible_menus:
+                    menu.render(self.screen)
                 # Draw game notification overlays on FTL/Zomboid windows
                 if isinstance(menu, FTLWindow):
                     notification = self.game_notifications.active_notifications.get("ftl")
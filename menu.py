@@ -5,15 +5,14 @@ Handles overlapping windows, drag and drop, and menu items
 
 import pygame
 import os
+from themed_windows import load_image, render_text
 
 class MenuItem:
     """A draggable item within a menu window"""
     def __init__(self, image_filename, position, assets_path):
         self.image_filename = image_filename
         self.assets_path = assets_path
-        self.image = pygame.image.load(
-            os.path.join(assets_path, image_filename)
-        ).convert_alpha()
+        self.image = load_image(os.path.join(assets_path, image_filename), alpha=True)
         self.rect = self.image.get_rect()
         self.rect.topleft = position
         self.dragging = False
@@ -62,14 +61,11 @@ class MenuWindow:
         # Load window assets
         # Use only the background, not the overlay (which may have text baked in)
         try:
-            titlebar_img = pygame.image.load(
-                os.path.join(assets_path, "window_titlebar_background_800x40.png")
-            ).convert_alpha()
+            titlebar_path = os.path.join(assets_path, "window_titlebar_background_800x40.png")
+            self.titlebar_bg = load_image(titlebar_path, alpha=True)
             # Scale to match window width
-            if titlebar_img.get_width() != self.width:
-                self.titlebar_bg = pygame.transform.scale(titlebar_img, (self.width, 40))
-            else:
-                self.titlebar_bg = titlebar_img
+            if self.titlebar_bg.get_width() != self.width:
+                self.titlebar_bg = load_image(titlebar_path, (self.width, 40), alpha=True)
         except:
             # Fallback: create a simple Windows-style titlebar
             self.titlebar_bg = pygame.Surface((self.width, 40))
@@ -78,12 +74,8 @@ class MenuWindow:
                 color_val = int(240 - (y / 40) * 20)  # Slight gradient
                 pygame.draw.line(self.titlebar_bg, (color_val, color_val, color_val), (0, y), (self.width, y))
         
-        self.close_icon = pygame.image.load(
-            os.path.join(assets_path, "icon_close_x_20x20.png")
-        ).convert_alpha()
-        self.minimize_icon = pygame.image.load(
-            os.path.join(assets_path, "icon_minimize_20x20.png")
-        ).convert_alpha()
+        self.close_icon = load_image(os.path.join(assets_path, "icon_close_x_20x20.png"), alpha=True)
+        self.minimize_icon = load_image(os.path.join(assets_path, "icon_minimize_20x20.png"), alpha=True)
         
         # Calculate button positions
         self.titlebar_height = 40
@@ -243,8 +235,7 @@ class MenuWindow:
         screen.blit(self.titlebar_bg, (self.position[0], self.position[1]))
         
         # Draw title text (with better styling)
-        font = pygame.font.Font(None, 20)
-        title_text = font.render(self.title, True, (255, 255, 255))
+        title_text = render_text(20, self.title, (255, 255, 255))
         # Center vertically in titlebar
         text_y = self.position[1] + (self.titlebar_height - title_text.get_height()) // 2
         screen.blit(title_text, (self.position[0] + 10, text_y))
@@ -6,6 +6,7 @@ Shows Messages (iMessage) notifications in the top right that stack and slide up
 import pygame
 import random
 import time
+from themed_windows import get_font, render_text
 
 class MessagesNotification:
     """A single Messages notification"""
@@ -76,13 +77,12 @@ class MessagesNotification:
                           (icon_x + icon_size // 2, icon_y + icon_size // 2), icon_size // 2)
         
         # Draw contact and message
-        font_title = pygame.font.Font(None, 20)
-        font_message = pygame.font.Font(None, 16)
+        font_message = get_font(16)
         
         text_x = icon_x + icon_size + padding
         
         # Contact name
-        contact_text = font_title.render(self.contact, True, (0, 0, 0))
+        contact_text = render_text(20, self.contact, (0, 0, 0))
         notification.blit(contact_text, (text_x, padding))
         
         # Message preview (truncate if too long)
@@ -93,7 +93,7 @@ class MessagesNotification:
                 message_display = message_display[:-1]
             message_display += "..."
         
-        message_text = font_message.render(message_display, True, (100, 100, 100))
+        message_text = render_text(16, message_display, (100, 100, 100))
         notification.blit(message_text, (text_x, padding + 22))
         
         # Draw to screen
@@ -5,6 +5,7 @@ Shows text notifications at progress milestones (25%, 50%, 75%, 90%)
 
 import pygame
 import time
+from themed_windows import render_text
 
 class MilestoneNotification:
     """A single milestone notification"""
@@ -55,8 +56,7 @@ class MilestoneNotification:
                         pygame.Rect(0, 0, self.width, self.height), 2)
         
         # Draw text
-        font = pygame.font.Font(None, 32)
-        text_surface = font.render(self.text, True, (255, 255, 255))
+        text_surface = render_text(32, self.text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 2))
         notification.blit(text_surface, text_rect)
         
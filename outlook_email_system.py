@@ -15,7 +15,9 @@ class OutlookEmailSystem:
         self.last_email_time = time.time()
         self.email_interval = random.uniform(10.0, 20.0)  # 10-20 seconds between emails
         self.congratulatory_chance = 0.3  # 30% chance for congratulatory email
-        self.congratulatory_sent = set()  # Track sent congratulatory emails
+        # Bit i is set once CONGRATULATORY_EMAILS[i] has been sent
+        self.congratulatory_sent_mask = 0
+        self.all_congratulatory_mask = (1 << len(CONGRATULATORY_EMAILS)) - 1
     
     def update(self):
         """Update email delivery system"""
@@ -25,7 +27,7 @@ class OutlookEmailSystem:
         if time_since_last >= self.email_interval:
             # Decide if this should be a congratulatory email
             if (random.random() < self.congratulatory_chance and 
-                len(self.congratulatory_sent) < len(CONGRATULATORY_EMAILS)):
+                self.congratulatory_sent_mask != self.all_congratulatory_mask):
                 # Send a congratulatory email
                 self._send_congratulatory_email(current_time)
             else:
@@ -38,14 +40,16 @@ class OutlookEmailSystem:
     def _send_congratulatory_email(self, timestamp):
         """Send a congratulatory email about Calvelli's work"""
         # Get an unsent congratulatory email
-        available = [e for e in CONGRATULATORY_EMAILS if id(e) not in self.congratulatory_sent]
+        sent_mask = self.congratulatory_sent_mask
+        available = [i for i in range(len(CONGRATULATORY_EMAILS)) if not sent_mask & (1 << i)]
         if not available:
             # All sent, reset and start over
-            self.congratulatory_sent.clear()
-            available = CONGRATULATORY_EMAILS
+            self.congratulatory_sent_mask = 0
+            available = range(len(CONGRATULATORY_EMAILS))
         
-        email_template = random.choice(available)
-        self.congratulatory_sent.add(id(email_template))
+        index = random.choice(available)
+        self.congratulatory_sent_mask |= 1 << index
+        email_template = CONGRATULATORY_EMAILS[index]
         
         # Add the congratulatory email to Outlook
         self.outlook_window._add_congratulatory_email(email_template, timestamp)
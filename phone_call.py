@@ -9,6 +9,7 @@ import time
 import math
 import json
 import os
+from themed_windows import get_font, render_text
 
 class PhoneCall:
     """Represents an incoming phone call"""
@@ -356,35 +357,32 @@ class PhoneCallSystem:
             pygame.draw.rect(screen, (100, 100, 100), self.call_popup_rect, 3)
             
             # Draw caller info
-            font_large = pygame.font.Font(None, 32)
-            font_medium = pygame.font.Font(None, 24)
-            
             # Always render caller name on a single line (no forced wrapping)
             caller_name = self.active_call.caller_name
-            caller_text = font_large.render(caller_name, True, (0, 0, 0))
+            caller_text = render_text(32, caller_name, (0, 0, 0))
             caller_rect = caller_text.get_rect(center=(self.popup_x + self.popup_width // 2, self.popup_y + 45))
             screen.blit(caller_text, caller_rect)
             
-            number_text = font_medium.render(self.active_call.caller_number, True, (100, 100, 100))
+            number_text = render_text(24, self.active_call.caller_number, (100, 100, 100))
             number_rect = number_text.get_rect(center=(self.popup_x + self.popup_width // 2, self.popup_y + 75))
             screen.blit(number_text, number_rect)
             
             # Draw "Incoming Call" text
-            incoming_text = font_medium.render("Incoming Call", True, (50, 50, 50))
+            incoming_text = render_text(24, "Incoming Call", (50, 50, 50))
             incoming_rect = incoming_text.get_rect(center=(self.popup_x + self.popup_width // 2, self.popup_y + 110))
             screen.blit(incoming_text, incoming_rect)
             
             # Draw answer button (green)
             pygame.draw.rect(screen, (0, 180, 0), self.answer_button_rect)
             pygame.draw.rect(screen, (0, 120, 0), self.answer_button_rect, 2)
-            answer_text = font_medium.render("Answer", True, (255, 255, 255))
+            answer_text = render_text(24, "Answer", (255, 255, 255))
             answer_rect = answer_text.get_rect(center=self.answer_button_rect.center)
             screen.blit(answer_text, answer_rect)
             
             # Draw hang up button (red)
             pygame.draw.rect(screen, (200, 0, 0), self.hangup_button_rect)
             pygame.draw.rect(screen, (150, 0, 0), self.hangup_button_rect, 2)
-            hangup_text = font_medium.render("Hang Up", True, (255, 255, 255))
+            hangup_text = render_text(24, "Hang Up", (255, 255, 255))
             hangup_rect = hangup_text.get_rect(center=self.hangup_button_rect.center)
             screen.blit(hangup_text, hangup_rect)
         
@@ -423,7 +421,7 @@ class PhoneCallSystem:
             pygame.draw.rect(screen, (60, 60, 60), title_bar)
             
             # Caller name in title (always inline, with simple cutoff before duration)
-            font_small = pygame.font.Font(None, 18)
+            font_small = get_font(18)
             caller_name = self.active_call.caller_name
             full_title = f"Call with {caller_name}"
             # Leave some space on the right for the duration text
@@ -432,14 +430,14 @@ class PhoneCallSystem:
             # Truncate and add "..." if too wide
             while font_small.size(title_str)[0] > max_title_width and len(title_str) > 3:
                 title_str = title_str[:-4] + "..."
-            title_text = font_small.render(title_str, True, (255, 255, 255))
+            title_text = render_text(18, title_str, (255, 255, 255))
             screen.blit(title_text, (self.conv_x + 10, title_bar_y + 8))
             
             # Call duration indicator
             if self.active_call.start_time:
                 elapsed = time.time() - self.active_call.start_time
                 remaining = max(0, self.active_call.conversation_duration - elapsed)
-                duration_text = font_small.render(f"{remaining:.1f}s", True, (150, 150, 150))
+                duration_text = render_text(18, f"{remaining:.1f}s", (150, 150, 150))
                 screen.blit(duration_text, (self.conv_x + self.conv_width - 50, title_bar_y + 8))
             
             # Content area (below title bar)
@@ -451,8 +449,8 @@ class PhoneCallSystem:
             pygame.draw.rect(screen, (35, 35, 35), content_rect)  # Slightly lighter than window bg
             
             # Message display
-            font_conv = pygame.font.Font(None, 16)
-            font_speaker = pygame.font.Font(None, 14)
+            font_conv = get_font(16)
+            font_speaker = get_font(14)
             max_width = self.conv_width - 30  # Leave padding
 
             # Compute a consistent label width so all messages align nicely
@@ -508,8 +506,7 @@ class PhoneCallSystem:
                 
                 for word in words:
                     test_line = current_line + (" " if current_line else "") + word
-                    test_surface = font_conv.render(test_line, True, (255, 255, 255))
-                    if test_surface.get_width() <= available_width:
+                    if font_conv.size(test_line)[0] <= available_width:
                         current_line = test_line
                     else:
                         if current_line:
@@ -566,7 +563,7 @@ class PhoneCallSystem:
                 
                 # Draw speaker label (left column)
                 speaker_label = self.active_call.caller_name if speaker == "caller" else "You"
-                speaker_surface = font_speaker.render(speaker_label + ":", True, speaker_color)
+                speaker_surface = render_text(14, speaker_label + ":", speaker_color)
                 
                 # Only draw if within visible bounds
                 if message_y >= content_y and message_y < content_y + content_height:
@@ -581,8 +578,7 @@ class PhoneCallSystem:
                 
                 for word in words:
                     test_line = current_line + (" " if current_line else "") + word
-                    test_surface = font_conv.render(test_line, True, text_color)
-                    if test_surface.get_width() <= available_width:
+                    if font_conv.size(test_line)[0] <= available_width:
                         current_line = test_line
                     else:
                         if current_line:
@@ -595,7 +591,7 @@ class PhoneCallSystem:
                 for i, line in enumerate(lines):
                     line_y = message_y + i * line_height
                     if line_y >= content_y and line_y < content_y + content_height:
-                        line_surface = font_conv.render(line, True, text_color)
+                        line_surface = render_text(16, line, text_color)
                         screen.blit(line_surface, (text_column_x, line_y))
                 
                 # Add typing cursor for current message
@@ -607,8 +603,7 @@ class PhoneCallSystem:
                     cursor_x = text_column_x
                     if lines:
                         last_line = lines[-1]
-                        last_line_surface = font_conv.render(last_line, True, text_color)
-                        cursor_x += last_line_surface.get_width()
+                        cursor_x += font_conv.size(last_line)[0]
                     else:
                         cursor_x += speaker_surface.get_width()
                     
@@ -5,6 +5,7 @@ Shows +number popup animation over progress bar when progress increases
 
 import pygame
 import time
+from themed_windows import render_text
 
 class ProgressPopup:
     """A single progress popup animation"""
@@ -49,8 +50,7 @@ class ProgressPopup:
             alpha = int(self.start_alpha * (1.0 - phase))
         
         # Create text
-        font = pygame.font.Font(None, int(32 * scale))
-        text = font.render(f"+{self.amount:.1f}%", True, (50, 200, 50))  # Green
+        text = render_text(int(32 * scale), f"+{self.amount:.1f}%", (50, 200, 50))  # Green
         
         # Create surface with alpha
         text_surface = pygame.Surface(text.get_size(), pygame.SRCALPHA)
@@ -6,6 +6,7 @@ Shows Slack notifications in the top right that stack and slide up
 import pygame
 import random
 import time
+from themed_windows import get_font, render_text
 
 class SlackNotification:
     """A single Slack notification"""
@@ -77,13 +78,12 @@ class SlackNotification:
                         pygame.Rect(icon_x, icon_y, icon_size, icon_size))
         
         # Draw channel and user
-        font_title = pygame.font.Font(None, 20)
-        font_message = pygame.font.Font(None, 16)
+        font_message = get_font(16)
         
         text_x = icon_x + icon_size + padding
         
         # Channel name
-        channel_text = font_title.render(self.channel, True, (0, 0, 0))
+        channel_text = render_text(20, self.channel, (0, 0, 0))
         notification.blit(channel_text, (text_x, padding))
         
         # Message preview (truncate if too long)
@@ -94,7 +94,7 @@ class SlackNotification:
                 message_display = message_display[:-1]
             message_display += "..."
         
-        message_text = font_message.render(message_display, True, (100, 100, 100))
+        message_text = render_text(16, message_display, (100, 100, 100))
         notification.blit(message_text, (text_x, padding + 22))
         
         # Draw to screen
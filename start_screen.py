@@ -7,6 +7,7 @@ import pygame
 import sys
 import time
 import math
+from themed_windows import render_text
 
 class StartScreen:
     """The start screen shown before the game begins"""
@@ -21,11 +22,9 @@ class StartScreen:
         self.background = pygame.Surface((self.width, self.height))
         self._draw_gradient_background()
         
-        # Fonts (larger main menu typography)
+        # Fonts for the pulsing text (larger main menu typography); fixed-colour text goes through render_text
         self.title_font = pygame.font.Font(None, 128)
-        self.subtitle_font = pygame.font.Font(None, 44)
         self.instruction_font = pygame.font.Font(None, 36)
-        self.tagline_font = pygame.font.Font(None, 24)
         
         # Animation state
         self.pulse_phase = 0.0
@@ -112,13 +111,13 @@ class StartScreen:
             self.screen.blit(title_glow, glow_rect)
         
         # Main title
-        title_text = self.title_font.render("Menu Simulator", True, (255, 255, 255))
+        title_text = render_text(128, "Menu Simulator", (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, title_y + pulse_offset))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle with underline
         subtitle_y = title_y + 80
-        subtitle_text = self.subtitle_font.render("Fundraising for a Conference", True, (180, 200, 255))
+        subtitle_text = render_text(44, "Fundraising for a Conference", (180, 200, 255))
         subtitle_rect = subtitle_text.get_rect(center=(self.width // 2, subtitle_y))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -132,7 +131,7 @@ class StartScreen:
         
         # Tagline
         tagline_y = subtitle_y + 60
-        tagline_text = self.tagline_font.render("A game about clicking menus while someone else does the work", True, (120, 140, 160))
+        tagline_text = render_text(24, "A game about clicking menus while someone else does the work", (120, 140, 160))
         tagline_rect = tagline_text.get_rect(center=(self.width // 2, tagline_y))
         self.screen.blit(tagline_text, tagline_rect)
         
@@ -155,18 +154,18 @@ class StartScreen:
         
         # Keyboard hint
         hint_y = instruction_y + 50
-        hint_text = self.tagline_font.render("Press ESC to exit at any time", True, (80, 90, 100))
+        hint_text = render_text(24, "Press ESC to exit at any time", (80, 90, 100))
         hint_rect = hint_text.get_rect(center=(self.width // 2, hint_y))
         self.screen.blit(hint_text, hint_rect)
         
         # Version/credit text at bottom
         credit_y = self.height - 60
-        version_text = self.tagline_font.render("Menu Simulator v1.0", True, (60, 70, 80))
+        version_text = render_text(24, "Menu Simulator v1.0", (60, 70, 80))
         version_rect = version_text.get_rect(center=(self.width // 2, credit_y))
         self.screen.blit(version_text, version_rect)
         
         # Author credit just below
         author_y = credit_y + 20
-        author_text = self.tagline_font.render("A game by gblwrks", True, (80, 90, 100))
+        author_text = render_text(24, "A game by gblwrks", (80, 90, 100))
         author_rect = author_text.get_rect(center=(self.width // 2, author_y))
         self.screen.blit(author_text, author_rect)
@@ -7,6 +7,7 @@ import pygame
 import time
 import math
 import random
+from themed_windows import get_font
 
 class StartupAnimation:
     """Manages the startup animation sequence"""
@@ -28,6 +29,12 @@ class StartupAnimation:
         self.spinner_angle = 0.0
         self.spinner_radius = 30
         self.spinner_center = (self.width // 2, self.height // 2)
+        # Unit vectors for the 8 spinner dots at angle 0; rotated as a group each frame
+        num_dots = 8
+        self.spinner_dots = [
+            (math.cos(math.radians(i * 360 / num_dots)), math.sin(math.radians(i * 360 / num_dots)))
+            for i in range(num_dots)
+        ]
         
         # Random login message
         login_messages = [
@@ -46,7 +53,6 @@ class StartupAnimation:
         
         # Window opening animation
         self.window_open_duration = 0.5  # 0.5 seconds
-        self.window_animations = {}  # Track each window's animation state
         
         # Initialize window animations
         if self.windows:
@@ -55,8 +61,8 @@ class StartupAnimation:
             self.taskbar_icon_x = self.width // 2
             
             for i, window in enumerate(self.windows):
-                # Store original position
-                original_pos = window.position[:]
+                # Store original position (tuple snapshot; restored as a list once at the end)
+                original_pos = tuple(window.position)
                 original_alpha = getattr(window, 'opening_alpha', 255)
                 
                 # Start windows at taskbar icon position (small)
@@ -67,16 +73,23 @@ class StartupAnimation:
                 window.opening_alpha = 0  # Start invisible
                 window.opening_progress = 0.0
                 
-                self.window_animations[id(window)] = {
+                # Each window carries its own animation state
+                window._startup_anim = {
                     'start_time': None,  # Will be set when animation starts
                     'original_pos': original_pos,
                     'original_alpha': original_alpha
                 }
         
+        # Draw order for the opening animation (z_index doesn't change during startup)
+        self._z_sorted_windows = sorted(self.windows, key=lambda w: w.z_index)
+        
         # Create overlay for fade
         self.overlay = pygame.Surface((self.width, self.height))
         self.overlay.fill((0, 0, 0))
         
+        # Signature of the last frame drawn, used to skip identical frames
+        self._last_sig = None
+        
     def update(self, dt):
         """Update animation state
         dt: time since last update in seconds
@@ -112,100 +125,128 @@ class StartupAnimation:
                 self.phase_start_time = current_time
                 # Initialize window animation start times (staggered slightly)
                 for i, window in enumerate(self.windows):
-                    window_id = id(window)
-                    if window_id in self.window_animations:
-                        self.window_animations[window_id]['start_time'] = current_time + (i * 0.05)  # 50ms stagger
+                    window._startup_anim['start_time'] = current_time + (i * 0.05)  # 50ms stagger
         
         elif self.current_phase == "windows_opening":
             # Animate windows opening from taskbar icon
             current_time = time.time()
             all_complete = True
             
+            advance = self._advance_window
             for window in self.windows:
-                window_id = id(window)
-                if window_id not in self.window_animations:
-                    continue
-                
-                anim_data = self.window_animations[window_id]
-                if anim_data['start_time'] is None:
-                    continue
-                
-                window_elapsed = current_time - anim_data['start_time']
-                if window_elapsed < 0:
-                    all_complete = False
-                    continue
-                
-                progress = min(window_elapsed / self.window_open_duration, 1.0)
-                window.opening_progress = progress
-                
-                # Ease out cubic for smooth animation
-                eased_progress = 1.0 - pow(1.0 - progress, 3)
-                
-                # Interpolate position
-                start_x, start_y = window.opening_start_pos
-                target_x, target_y = window.opening_target_pos
-                window.position[0] = int(start_x + (target_x - start_x) * eased_progress)
-                window.position[1] = int(start_y + (target_y - start_y) * eased_progress)
-                
-                # Interpolate size
-                start_w, start_h = window.opening_start_size
-                target_w, target_h = window.opening_target_size
-                window.width = int(start_w + (target_w - start_w) * eased_progress)
-                window.height = int(start_h + (target_h - start_h) * eased_progress)
-                
-                # Interpolate alpha (fade in)
-                window.opening_alpha = int(255 * eased_progress)
-                
-                if progress < 1.0:
+                if not advance(window, current_time):
                     all_complete = False
-                else:
-                    # Animation complete, restore original values
-                    window.position = anim_data['original_pos'][:]
-                    window.width = window.opening_target_size[0]
-                    window.height = window.opening_target_size[1]
-                    window.opening_alpha = 255
-                    window.opening_progress = 1.0
             
             if all_complete:
                 return True  # Entire startup sequence complete
         
         return False
     
+    def _advance_window(self, window, current_time):
+        """Move one window along its opening animation; returns True once it has finished"""
+        anim_data = window._startup_anim
+        if anim_data['start_time'] is None:
+            return True
+        
+        window_elapsed = current_time - anim_data['start_time']
+        if window_elapsed < 0:
+            return False
+        
+        progress = min(window_elapsed / self.window_open_duration, 1.0)
+        window.opening_progress = progress
+        
+        # Ease out cubic for smooth animation (multiplication avoids the pow() call)
+        remaining = 1.0 - progress
+        eased_progress = 1.0 - remaining * remaining * remaining
+        
+        # Interpolate position
+        start_x, start_y = window.opening_start_pos
+        target_x, target_y = window.opening_target_pos
+        window.position = [int(start_x + (target_x - start_x) * eased_progress),
+                           int(start_y + (target_y - start_y) * eased_progress)]
+        
+        # Interpolate size
+        start_w, start_h = window.opening_start_size
+        target_w, target_h = window.opening_target_size
+        window.width = int(start_w + (target_w - start_w) * eased_progress)
+        window.height = int(start_h + (target_h - start_h) * eased_progress)
+        
+        # Interpolate alpha (fade in)
+        window.opening_alpha = int(255 * eased_progress)
+        
+        if progress < 1.0:
+            return False
+        
+        # Animation complete, restore original values
+        window.position = list(anim_data['original_pos'])
+        window.width = window.opening_target_size[0]
+        window.height = window.opening_target_size[1]
+        window.opening_alpha = 255
+        window.opening_progress = 1.0
+        return True
+    
+    def invalidate_z_order(self):
+        """Re-sort the cached draw order after a window's z_index changes"""
+        self._z_sorted_windows = sorted(self.windows, key=lambda w: w.z_index)
+    
     def is_complete(self):
         """Check if animation is complete"""
         if self.current_phase == "windows_opening":
             return all(hasattr(w, 'opening_progress') and w.opening_progress >= 1.0 for w in self.windows)
         return self.current_phase == "fade_in" and self.fade_alpha <= 0
     
+    def _render_signature(self):
+        """Describe what the current frame will look like, or None if it must always be drawn
+        
+        Only phases whose output depends solely on these values can be skipped;
+        fade_in blends onto the previous frame and windows_opening moves every frame.
+        """
+        if self.current_phase == "screen_on":
+            return (self.current_phase, int(255 * self.screen_brightness))
+        if self.current_phase == "logging_in":
+            return (self.current_phase, int(self.spinner_angle) % 360)
+        return None
+    
     def render(self, game_background):
         """Render the animation"""
+        sig = self._render_signature()
+        if sig is not None and sig == self._last_sig:
+            return  # Screen already shows this frame
+        previous_phase = self._last_sig[0] if self._last_sig else None
+        self._last_sig = sig
+        
         if self.current_phase == "screen_on":
             # Draw black screen that brightens
             brightness = int(255 * self.screen_brightness)
             self.screen.fill((brightness, brightness, brightness))
         
         elif self.current_phase == "logging_in":
-            # Draw white screen with spinner
-            self.screen.fill((255, 255, 255))
-            
-            # Draw login message text
-            font = pygame.font.Font(None, 36)
-            text = font.render(self.login_message + "...", True, (100, 100, 100))
-            # Move the text a bit further above the spinner to add visual breathing room
-            text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 80))
-            self.screen.blit(text, text_rect)
-            
-            # Draw spinner (circle with rotating dots)
             center_x, center_y = self.spinner_center
-            num_dots = 8
-            for i in range(num_dots):
-                angle = math.radians(self.spinner_angle + (i * 360 / num_dots))
-                dot_x = center_x + self.spinner_radius * math.cos(angle)
-                dot_y = center_y + self.spinner_radius * math.sin(angle)
+            if previous_phase != "logging_in":
+                # Draw white screen with spinner
+                self.screen.fill((255, 255, 255))
                 
-                # Fade dots based on position
-                dot_alpha = int(255 * (0.3 + 0.7 * (i / num_dots)))
-                dot_color = (100, 100, 100)
+                # Draw login message text
+                text = get_font(36).render(self.login_message + "...", True, (100, 100, 100))
+                # Move the text a bit further above the spinner to add visual breathing room
+                text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 80))
+                self.screen.blit(text, text_rect)
+            else:
+                # Text is still on screen; only clear the area the spinner covers
+                extent = self.spinner_radius + 6
+                self.screen.fill((255, 255, 255),
+                                 pygame.Rect(center_x - extent, center_y - extent, extent * 2, extent * 2))
+            
+            # Draw spinner (circle with rotating dots)
+            # Rotate the precomputed unit vectors: 2 trig calls per frame instead of 16
+            angle = math.radians(self.spinner_angle)
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
+            radius = self.spinner_radius
+            dot_color = (100, 100, 100)
+            for base_x, base_y in self.spinner_dots:
+                dot_x = center_x + radius * (base_x * cos_a - base_y * sin_a)
+                dot_y = center_y + radius * (base_x * sin_a + base_y * cos_a)
                 pygame.draw.circle(self.screen, dot_color, (int(dot_x), int(dot_y)), 5)
         
         elif self.current_phase == "fade_in":
@@ -226,19 +267,46 @@ class StartupAnimation:
             self.screen.blit(game_background, (0, 0))
             
             # Draw full window contents at their animated size/position
-            for window in sorted(self.windows, key=lambda w: w.z_index):
-                # Render full window into an off-screen surface at origin
-                content_surface = pygame.Surface((window.width, window.height), pygame.SRCALPHA)
-                old_pos = list(window.position)
-                window.position = [0, 0]
-                
-                if hasattr(window, "render_for_startup"):
-                    window.render_for_startup(content_surface)
-                else:
-                    window.render(content_surface)
-                
-                window.position = old_pos
-                
-                # Apply opening alpha and blit at animated position
-                content_surface.set_alpha(window.opening_alpha)
-                self.screen.blit(content_surface, window.position)
\ No newline at end of file
+            for window in self._z_sorted_windows:
+                self._draw_opening_window(window)
+    
+    def _draw_opening_window(self, window):
+        """Draw one window at its animated size, position and alpha"""
+        # Render full window into an off-screen surface at origin
+        content_surface = pygame.Surface((window.width, window.height), pygame.SRCALPHA)
+        # position is swapped out rather than mutated, so the original list needs no copy
+        old_pos = window.position
+        window.position = [0, 0]
+        
+        if hasattr(window, "render_for_startup"):
+            window.render_for_startup(content_surface)
+        else:
+            window.render(content_surface)
+        
+        window.position = old_pos
+        
+        # Apply opening alpha and blit at animated position
+        content_surface.set_alpha(window.opening_alpha)
+        self.screen.blit(content_surface, window.position)
+    
+    def step_and_render(self, dt, game_background):
+        """Update and draw one frame; returns True once the startup sequence is complete
+        
+        While windows are opening, each window is advanced and drawn in the same
+        pass instead of walking the window list once in update() and again in render().
+        """
+        if self.current_phase != "windows_opening":
+            complete = self.update(dt)
+            self.render(game_background)
+            return complete
+        
+        current_time = time.time()
+        all_complete = True
+        self.screen.blit(game_background, (0, 0))
+        advance = self._advance_window
+        draw = self._draw_opening_window
+        for window in self._z_sorted_windows:
+            if not advance(window, current_time):
+                all_complete = False
+            draw(window)
+        return all_complete
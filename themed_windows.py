@@ -3,16 +3,135 @@ Themed Window Classes
 Different application-style windows for the game
 """
 
+import collections
+import functools
+import itertools
 import pygame
 import os
 import random
 import time
+from messages_content import (
+    REGULAR_EMAIL_SENDERS,
+    REGULAR_EMAIL_SUBJECTS,
+    CONGRATULATORY_EMAILS,
+    REGULAR_EMAILS
+)
+
+# Loaded images keyed by (path, size, alpha), shared by every window
+_image_cache = {}
+
+# Fonts shared by every window, keyed by size (created lazily, after pygame.font is set up)
+_font_cache = {}
+
+
+def load_image(path, size=None, alpha=False):
+    """Load an image converted to the display format (and scaled), loading each variant once
+    
+    The returned Surface is shared between windows and must not be modified.
+    """
+    key = (path, size, alpha)
+    image = _image_cache.get(key)
+    if image is None:
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        _image_cache[key] = image
+    return image
+
+
+def get_font(size):
+    """Return the default font at the given size, creating it only once"""
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.Font(None, size)
+    return font
+
+
+@functools.lru_cache(maxsize=512)
+def render_text(size, text, color):
+    """Return an antialiased text Surface in the display format, reusing it for repeated (size, text, color)
+    
+    The returned Surface is shared between callers and must not be modified.
+    """
+    return get_font(size).render(text, True, color).convert_alpha()
+
+
+@functools.lru_cache(maxsize=64)
+def darken(color, amount):
+    """Return color with each channel lowered by amount (clamped at 0), built once per pair"""
+    return tuple(max(0, c - amount) for c in color)
+
+
+def format_clock_time(timestamp):
+    """Format a Unix timestamp as local 12-hour time, e.g. "09:05 PM" (same as strftime("%I:%M %p"))"""
+    local = time.localtime(timestamp)
+    hour = local.tm_hour % 12 or 12
+    return f"{hour:02d}:{local.tm_min:02d} {'PM' if local.tm_hour >= 12 else 'AM'}"
+
+
+def stacked_row_at(pos, top_left, row_width, row_height, pitch, count):
+    """Index of the row under pos in a vertical stack of count rows spaced pitch apart, or None"""
+    dx = pos[0] - top_left[0]
+    dy = pos[1] - top_left[1]
+    if 0 <= dx < row_width and 0 <= dy < count * pitch and dy % pitch < row_height:
+        return dy // pitch
+    return None
+
+
+def blit_centered(surface, image, center):
+    """Blit image centred on center, placed exactly as image.get_rect(center=center) would be"""
+    width, height = image.get_size()
+    surface.blit(image, (center[0] - width // 2, center[1] - height // 2))
+
+
+def draw_option_button(surface, rect, label, size, fill, border, text_color):
+    """Draw a filled, outlined button with its label centred"""
+    surface.fill(fill, rect)
+    pygame.draw.rect(surface, border, rect, 1)
+    blit_centered(surface, render_text(size, label, text_color), rect.center)
+
+
+def build_button(label, width, height, size, fill, border, text_color):
+    """Pre-draw a single outlined button with its label centred"""
+    button = pygame.Surface((width, height))
+    draw_option_button(button, button.get_rect(), label, size, fill, border, text_color)
+    return button.convert()
+
+
+def build_option_panel(labels, row_width, row_height, pitch, size, fill, border, text_color):
+    """Pre-draw a vertical stack of option buttons onto one transparent Surface"""
+    panel = pygame.Surface((row_width, max(len(labels) * pitch - (pitch - row_height), 0)), pygame.SRCALPHA)
+    for i, label in enumerate(labels):
+        draw_option_button(panel, pygame.Rect(0, i * pitch, row_width, row_height),
+                           label, size, fill, border, text_color)
+    return panel.convert_alpha()
+
+
+@functools.lru_cache(maxsize=128)
+def wrap_text(text, size, max_width):
+    """Greedily wrap text into lines narrower than max_width, reusing earlier results"""
+    font = get_font(size)
+    lines = []
+    current_line = ""
+    for word in text.split(' '):
+        test_line = current_line + word + " " if current_line else word + " "
+        if font.size(test_line)[0] < max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line.strip())
+            current_line = word + " "
+    if current_line:
+        lines.append(current_line.strip())
+    return tuple(lines)
+
 
 class ThemedWindow:
     """Base class for themed windows"""
     def __init__(self, title, position, width, height, assets_path, z_index=0):
         self.title = title
-        self.position = list(position)
+        self.position = position
         self.width = width
         self.height = height
         self.assets_path = assets_path
@@ -21,76 +140,81 @@ class ThemedWindow:
         self.drag_offset = (0, 0)
         self.is_blocked = False
         
-        # Load common assets
+        # Load common assets (shared with every other window through the image cache)
         self.titlebar_height = 40
         try:
-            titlebar_img = pygame.image.load(
-                os.path.join(assets_path, "ui", "window_titlebar_background_800x40.png")
-            ).convert_alpha()
-            if titlebar_img.get_width() != self.width:
-                self.titlebar_bg = pygame.transform.scale(titlebar_img, (self.width, 40))
-            else:
-                self.titlebar_bg = titlebar_img
+            titlebar_path = os.path.join(assets_path, "ui", "window_titlebar_background_800x40.png")
+            self.titlebar_bg = load_image(titlebar_path, alpha=True)
+            if self.titlebar_bg.get_width() != self.width:
+                self.titlebar_bg = load_image(titlebar_path, (self.width, 40), alpha=True)
         except:
-            self.titlebar_bg = pygame.Surface((self.width, 40))
+            self.titlebar_bg = pygame.Surface((self.width, 40)).convert()
             self.titlebar_bg.fill((200, 200, 200))
         
-        self.close_icon = pygame.image.load(
-            os.path.join(assets_path, "ui", "icon_close_x_20x20.png")
-        ).convert_alpha()
-        self.minimize_icon = pygame.image.load(
-            os.path.join(assets_path, "ui", "icon_minimize_20x20.png")
-        ).convert_alpha()
+        self.close_icon = load_image(os.path.join(assets_path, "ui", "icon_close_x_20x20.png"), alpha=True)
+        self.minimize_icon = load_image(os.path.join(assets_path, "ui", "icon_minimize_20x20.png"), alpha=True)
         
         # Button positions
         self.close_button_rect = pygame.Rect(
-            self.position[0] + self.width - 25,
-            self.position[1] + 10,
+            self._x + self.width - 25,
+            self._y + 10,
             20, 20
         )
         self.minimize_button_rect = pygame.Rect(
-            self.position[0] + self.width - 50,
-            self.position[1] + 10,
+            self._x + self.width - 50,
+            self._y + 10,
             20, 20
         )
         self.titlebar_rect = pygame.Rect(
-            self.position[0],
-            self.position[1],
+            self._x,
+            self._y,
             self.width,
             self.titlebar_height
         )
         
-        # Window background
-        self.background_surface = pygame.Surface((self.width, self.height))
+        # Window background, in the display format so blitting it takes the plain opaque copy path
+        self.background_surface = pygame.Surface((self.width, self.height)).convert()
         self.background_surface.fill((250, 250, 250))
+        
+        # Pre-composed titlebar, built on first render (subclasses may recolor the background first)
+        self.titlebar_composed = None
+        self._titlebar_key = None
+        
+        # Snapshot of the whole window for subclasses that render via _render_cached
+        self._cache_surface = None
+        self._dirty = True
+        # Set when only the part of the snapshot drawn by _draw_dirty_region needs redrawing
+        self._region_dirty = False
+        # Screen offset of the origin the window is being drawn at (non-zero while drawing a snapshot)
+        self._draw_offset = (0, 0)
+        # Where the left mouse button was last seen held down (None when released)
+        self._pressed_at = None
+    
+    @property
+    def position(self):
+        """Top-left corner as an (x, y) tuple; stored as plain ints for the hot paths"""
+        return (self._x, self._y)
+    
+    @position.setter
+    def position(self, value):
+        self._x, self._y = value
     
     def _update_button_positions(self):
-        """Update button positions when window is moved"""
-        self.close_button_rect = pygame.Rect(
-            self.position[0] + self.width - 25,
-            self.position[1] + 10,
-            20, 20
-        )
-        self.minimize_button_rect = pygame.Rect(
-            self.position[0] + self.width - 50,
-            self.position[1] + 10,
-            20, 20
-        )
-        self.titlebar_rect = pygame.Rect(
-            self.position[0],
-            self.position[1],
-            self.width,
-            self.titlebar_height
-        )
+        """Update button positions when window is moved (runs on every drag event, so the Rects are moved in place)"""
+        x, y = self._x, self._y
+        self.close_button_rect.topleft = (x + self.width - 25, y + 10)
+        self.minimize_button_rect.topleft = (x + self.width - 50, y + 10)
+        self.titlebar_rect.update(x, y, self.width, self.titlebar_height)
     
     def handle_click(self, pos):
         """Handle click on window"""
         if self.is_blocked:
             return False
         
-        # Check if click is anywhere within window bounds
-        window_rect = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
-        if not window_rect.collidepoint(pos):
+        # Check if click is anywhere within window bounds (same edges as Rect.collidepoint)
+        px, py = pos
+        x, y = self._x, self._y
+        if not (x <= px < x + self.width and y <= py < y + self.height):
             return False
         
         # Click is within window - bring to front will be handled by game.py
@@ -106,7 +230,7 @@ class ThemedWindow:
         
         if self.titlebar_rect.collidepoint(pos):
             self.dragging = True
-            self.drag_offset = (pos[0] - self.position[0], pos[1] - self.position[1])
+            self.drag_offset = (pos[0] - self._x, pos[1] - self._y)
             return True
         
         # Handle content clicks, but still return True to bring window to front
@@ -120,8 +244,8 @@ class ThemedWindow:
     def handle_drag(self, pos):
         """Handle drag"""
         if self.dragging:
-            self.position[0] = pos[0] - self.drag_offset[0]
-            self.position[1] = pos[1] - self.drag_offset[1]
+            self._x = pos[0] - self.drag_offset[0]
+            self._y = pos[1] - self.drag_offset[1]
             self._update_button_positions()
     
     def handle_release(self, pos):
@@ -130,18 +254,83 @@ class ThemedWindow:
     
     def contains_point(self, pos):
         """Check if point is within window"""
-        window_rect = pygame.Rect(self.position[0], self.position[1], self.width, self.height)
-        return window_rect.collidepoint(pos)
+        px, py = pos
+        x, y = self._x, self._y
+        return x <= px < x + self.width and y <= py < y + self.height
+    
+    def _compose_titlebar(self):
+        """Bake the titlebar background, title text and buttons into one opaque Surface"""
+        composed = pygame.Surface((self.width, self.titlebar_height)).convert()
+        # Window background first, so the result matches drawing the layers onto the window
+        composed.blit(self.background_surface, (0, 0))
+        composed.blit(self.titlebar_bg, (0, 0))
+        title_text = render_text(20, self.title, (0, 0, 0))  # Black text for visibility
+        composed.blit(title_text, (10, (self.titlebar_height - title_text.get_height()) // 2))
+        composed.blit(self.close_icon, (self.width - 25, 10))
+        composed.blit(self.minimize_icon, (self.width - 50, 10))
+        self.titlebar_composed = composed
+        self._titlebar_key = (self.title, self.width)
     
     def render_titlebar(self, screen):
         """Render the titlebar"""
-        screen.blit(self.titlebar_bg, (self.position[0], self.position[1]))
-        font = pygame.font.Font(None, 20)
-        title_text = font.render(self.title, True, (0, 0, 0))  # Black text for visibility
-        text_y = self.position[1] + (self.titlebar_height - title_text.get_height()) // 2
-        screen.blit(title_text, (self.position[0] + 10, text_y))
-        screen.blit(self.close_icon, self.close_button_rect.topleft)
-        screen.blit(self.minimize_icon, self.minimize_button_rect.topleft)
+        # Rebuild only when the title or width changes
+        if self._titlebar_key != (self.title, self.width):
+            self._compose_titlebar()
+        screen.blit(self.titlebar_composed, self.position)
+    
+    def mark_dirty(self):
+        """Force the cached window snapshot to be redrawn on the next render"""
+        self._dirty = True
+    
+    def mark_region_dirty(self):
+        """Redraw only the _draw_dirty_region part of the snapshot on the next render"""
+        self._region_dirty = True
+    
+    def _render_cached(self, screen):
+        """Blit the window snapshot, redrawing it with _draw_window only when needed
+        
+        For windows whose content changes only on known events; those events
+        must call mark_dirty(). Moving the window does not invalidate the snapshot.
+        """
+        size = (self.width, self.height)
+        if self._cache_surface is None or self._cache_surface.get_size() != size:
+            self._cache_surface = pygame.Surface(size).convert()
+            self._dirty = True
+        if self._dirty or self._region_dirty:
+            # Draw at the origin of the snapshot rather than at the window's screen position
+            position = self.position
+            self.position = [0, 0]
+            self._draw_offset = position
+            if self._dirty:
+                self._draw_window(self._cache_surface)
+            else:
+                self._draw_dirty_region(self._cache_surface)
+            self._draw_offset = (0, 0)
+            self.position = position
+            self._dirty = False
+            self._region_dirty = False
+        screen.blit(self._cache_surface, self.position)
+    
+    def _track_mouse_press(self):
+        """Mark the snapshot dirty when the held mouse moves, for windows with press feedback"""
+        pressed_at = pygame.mouse.get_pos() if pygame.mouse.get_pressed()[0] else None
+        if pressed_at != self._pressed_at:
+            self._pressed_at = pressed_at
+            self._dirty = True
+    
+    def _mouse_pos(self):
+        """Mouse position in the coordinates the window is currently being drawn in"""
+        mx, my = pygame.mouse.get_pos()
+        ox, oy = self._draw_offset
+        return (mx - ox, my - oy)
+    
+    def _draw_window(self, screen):
+        """Draw the full window at self.position - override in cached subclasses"""
+        raise NotImplementedError
+    
+    def _draw_dirty_region(self, screen):
+        """Redraw the part of the window flagged by mark_region_dirty (the whole window by default)"""
+        self._draw_window(screen)
     
     def render(self, screen=None):
         """Render the window - override in subclasses
@@ -158,13 +347,12 @@ class ThemedWindow:
         else:
             # Render titlebar to background surface
             titlebar_rect = pygame.Rect(0, 0, self.width, self.titlebar_height)
-            pygame.draw.rect(self.background_surface, (200, 200, 200), titlebar_rect)
-            font = pygame.font.Font(None, 20)
-            title_text = font.render(self.title, True, (0, 0, 0))
+            self.background_surface.fill((200, 200, 200), titlebar_rect)
+            title_text = render_text(20, self.title, (0, 0, 0))
             text_y = (self.titlebar_height - title_text.get_height()) // 2
             self.background_surface.blit(title_text, (10, text_y))
         
-        border_rect = pygame.Rect(0, 0, self.width, self.height) if screen is None else pygame.Rect(self.position[0], self.position[1], self.width, self.height)
+        border_rect = pygame.Rect(0, 0, self.width, self.height) if screen is None else pygame.Rect(self._x, self._y, self.width, self.height)
         pygame.draw.rect(target, (180, 180, 180), border_rect, 2)
 
 
@@ -174,21 +362,24 @@ class FTLWindow(ThemedWindow):
         super().__init__("FTL: Faster Than Light", position, width, height, assets_path, z_index)
         # Load FTL screenshot
         ftl_path = os.path.join(assets_path, "menus", "ftl.png")
-        self.ftl_image = pygame.image.load(ftl_path).convert()
-        # Scale to fit window
-        self.ftl_image = pygame.transform.scale(self.ftl_image, (width, height - self.titlebar_height))
+        # Scaled to fit window
+        self.ftl_image = load_image(ftl_path, (width, height - self.titlebar_height))
     
     def _handle_content_click(self, pos):
         """Handle clicks - game notifications will handle circle clicks"""
         return False  # Let game notifications handle clicks
     
     def render(self, screen):
+        # Static screenshot: draw once, then reuse the snapshot
+        self._render_cached(screen)
+    
+    def _draw_window(self, screen):
         screen.blit(self.background_surface, self.position)
         self.render_titlebar(screen)
         # Draw FTL screenshot in content area
-        screen.blit(self.ftl_image, (self.position[0], self.position[1] + self.titlebar_height))
+        screen.blit(self.ftl_image, (self._x, self._y + self.titlebar_height))
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(self._x, self._y, self.width, self.height), 2)
 
 
 class ZomboidWindow(ThemedWindow):
@@ -199,32 +390,36 @@ class ZomboidWindow(ThemedWindow):
         self.zomboid_images = []
         for i in range(1, 5):
             zomboid_path = os.path.join(assets_path, "menus", f"zomboid{i}.png")
-            img = pygame.image.load(zomboid_path).convert()
-            img = pygame.transform.scale(img, (width, height - self.titlebar_height))
-            self.zomboid_images.append(img)
+            self.zomboid_images.append(load_image(zomboid_path, (width, height - self.titlebar_height)))
         self.current_image = 0
-        self.cycle_timer = 0
+        self.cycle_elapsed = 0  # Total ms of update time, the current image follows from it
         self.cycle_interval = 3000  # Change every 3 seconds
     
     def update(self, dt):
         """Update cycling (dt is in milliseconds)"""
-        self.cycle_timer += dt
-        if self.cycle_timer >= self.cycle_interval:
-            self.cycle_timer = 0
-            self.current_image = (self.current_image + 1) % len(self.zomboid_images)
+        self.cycle_elapsed += dt
+        # Derived rather than stepped, so time past each 3s boundary carries over instead of drifting
+        image = (self.cycle_elapsed // self.cycle_interval) % len(self.zomboid_images)
+        if image != self.current_image:
+            self.current_image = image
+            self.mark_dirty()
     
     def _handle_content_click(self, pos):
         """Handle clicks - game notifications will handle circle clicks"""
         return False  # Let game notifications handle clicks
     
     def render(self, screen):
+        # Only changes when update() cycles to the next screenshot
+        self._render_cached(screen)
+    
+    def _draw_window(self, screen):
         screen.blit(self.background_surface, self.position)
         self.render_titlebar(screen)
         # Draw current zomboid screenshot
         screen.blit(self.zomboid_images[self.current_image], 
-                   (self.position[0], self.position[1] + self.titlebar_height))
+                   (self._x, self._y + self.titlebar_height))
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(self._x, self._y, self.width, self.height), 2)
 
 
 class InventoryWindow(ThemedWindow):
@@ -249,40 +444,58 @@ class InventoryWindow(ThemedWindow):
         ]
         for i, card_file in enumerate(card_files[:3]):
             try:
-                img = pygame.image.load(os.path.join(ui_path, card_file)).convert_alpha()
-                img = pygame.transform.scale(img, (self.slot_size - 10, self.slot_size - 10))
+                img = load_image(os.path.join(ui_path, card_file),
+                                 (self.slot_size - 10, self.slot_size - 10), alpha=True)
+                col, row = i % self.grid_cols, i // self.grid_cols
                 self.items.append({
                     'image': img,
-                    'slot': (i % self.grid_cols, i // self.grid_cols)
+                    'slot': (col, row),
+                    # Offset of the image from the window's top-left corner
+                    'offset': (
+                        self.grid_start_x + col * (self.slot_size + self.slot_padding) + 5,
+                        self.titlebar_height + self.grid_start_y + row * (self.slot_size + self.slot_padding) + 5
+                    )
                 })
             except:
                 pass
+        
+        self.grid_surface = self._build_grid_surface()
+    
+    def _build_grid_surface(self):
+        """Draw the slot grid and the items in it once; neither ever changes"""
+        step = self.slot_size + self.slot_padding
+        grid_width = self.grid_cols * step - self.slot_padding
+        grid_height = self.grid_rows * step - self.slot_padding
+        # Start from the window background so the gaps between slots match it
+        grid_rect = pygame.Rect(self.grid_start_x, self.titlebar_height + self.grid_start_y,
+                                grid_width, grid_height)
+        grid_surface = self.background_surface.subsurface(grid_rect).copy()
+        for row in range(self.grid_rows):
+            for col in range(self.grid_cols):
+                slot_rect = pygame.Rect(col * step, row * step, self.slot_size, self.slot_size)
+                # Draw slot background
+                grid_surface.fill((220, 220, 220), slot_rect)
+                pygame.draw.rect(grid_surface, (180, 180, 180), slot_rect, 2)
+        # Items on top of their slots, shifted from window to grid coordinates
+        grid_surface.blits([(item['image'], (item['offset'][0] - grid_rect.x, item['offset'][1] - grid_rect.y))
+                            for item in self.items], doreturn=False)
+        return grid_surface
     
     def render(self, screen):
+        # Grid and items are static: draw once, then reuse the snapshot
+        self._render_cached(screen)
+    
+    def _draw_window(self, screen):
         screen.blit(self.background_surface, self.position)
         self.render_titlebar(screen)
         
-        # Draw inventory grid
-        content_y = self.position[1] + self.titlebar_height
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                slot_x = self.position[0] + self.grid_start_x + col * (self.slot_size + self.slot_padding)
-                slot_y = content_y + self.grid_start_y + row * (self.slot_size + self.slot_padding)
-                # Draw slot background
-                pygame.draw.rect(screen, (220, 220, 220), 
-                               pygame.Rect(slot_x, slot_y, self.slot_size, self.slot_size))
-                pygame.draw.rect(screen, (180, 180, 180), 
-                               pygame.Rect(slot_x, slot_y, self.slot_size, self.slot_size), 2)
-        
-        # Draw items
-        for item in self.items:
-            col, row = item['slot']
-            slot_x = self.position[0] + self.grid_start_x + col * (self.slot_size + self.slot_padding) + 5
-            slot_y = content_y + self.grid_start_y + row * (self.slot_size + self.slot_padding) + 5
-            screen.blit(item['image'], (slot_x, slot_y))
+        # Draw inventory grid and items (pre-rendered, see _build_grid_surface)
+        content_y = self._y + self.titlebar_height
+        screen.blit(self.grid_surface,
+                    (self._x + self.grid_start_x, content_y + self.grid_start_y))
         
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(self._x, self._y, self.width, self.height), 2)
 
 
 class OutlookWindow(ThemedWindow):
@@ -292,27 +505,29 @@ class OutlookWindow(ThemedWindow):
         self.background_surface.fill((255, 255, 255))
         
         # Email list (will be populated with incoming emails)
-        self.emails = []
+        self.emails = collections.deque(maxlen=50)  # Newest first; the oldest drops off past 50
+        self.unread_count = 0  # Maintained by _insert_email and mark_read
         self.selected_email_index = None
         self.scroll_offset = 0
         self.max_visible_emails = 8
         self.viewing_email = None  # Currently viewing full email content (deprecated, using new window)
+        # Pre-drawn quick-reply buttons for the viewed email, rebuilt when the email or width changes
+        self._response_panel = None
+        self._response_panel_key = None
         self.blink_timer = 0  # For blinking urgent emails
         self.email_to_open = None  # Email to open in new window
+        self.sidebar_width = 150
+        self._layout_size = None  # Window size the cached list geometry was computed for
         
-        # Import email content
-        from messages_content import (
-            REGULAR_EMAIL_SENDERS, 
-            REGULAR_EMAIL_SUBJECTS,
-            CONGRATULATORY_EMAILS,
-            REGULAR_EMAILS
-        )
-        
+        # Email content
         self.email_senders = REGULAR_EMAIL_SENDERS
         self.email_subjects = REGULAR_EMAIL_SUBJECTS
         self.regular_emails = REGULAR_EMAILS
         self.congratulatory_emails = CONGRATULATORY_EMAILS
-        self.congratulatory_sent = set()  # Track which congratulatory emails have been sent
+        # Regular emails are dealt from a shuffled deck, so none repeats until every one has been sent
+        self._email_deck = list(REGULAR_EMAILS)
+        random.shuffle(self._email_deck)
+        self._deck_index = 0
         self.highlighted_email_index = None  # Index of currently highlighted email
         self.highlight_timer = 0  # Timer for highlight animation
         
@@ -320,12 +535,13 @@ class OutlookWindow(ThemedWindow):
     
     def _add_email(self, timestamp):
         """Add a new regular email to the inbox"""
-        from datetime import datetime
-        from messages_content import REGULAR_EMAILS
-        
-        # Pick a random email template from the loaded emails
-        if REGULAR_EMAILS:
-            email_template = random.choice(REGULAR_EMAILS)
+        # Deal the next email template from the shuffled deck, reshuffling once it runs out
+        if self._email_deck:
+            email_template = self._email_deck[self._deck_index]
+            self._deck_index += 1
+            if self._deck_index == len(self._email_deck):
+                random.shuffle(self._email_deck)
+                self._deck_index = 0
         else:
             # Fallback if no emails loaded
             email_template = {
@@ -336,8 +552,7 @@ class OutlookWindow(ThemedWindow):
             }
         
         # Format time
-        dt = datetime.fromtimestamp(timestamp)
-        time_str = dt.strftime("%I:%M %p")
+        time_str = format_clock_time(timestamp)
         
         email = {
             "subject": email_template["subject"],
@@ -350,20 +565,27 @@ class OutlookWindow(ThemedWindow):
             "responses": email_template.get("responses", [])
         }
         
-        # Add to beginning (newest first)
-        self.emails.insert(0, email)
-        
-        # Limit to 50 emails
-        if len(self.emails) > 50:
-            self.emails.pop()
+        self._insert_email(email)
+    
+    def _insert_email(self, email):
+        """Add an email to the top of the inbox, keeping unread_count in step"""
+        # A full deque drops its oldest email on appendleft, so account for it first
+        if len(self.emails) == self.emails.maxlen and not self.emails[-1].get('read', False):
+            self.unread_count -= 1
+        self.emails.appendleft(email)
+        if not email.get('read', False):
+            self.unread_count += 1
+    
+    def mark_read(self, email):
+        """Mark an inbox email as read, keeping unread_count in step"""
+        if not email.get('read', False):
+            email['read'] = True
+            self.unread_count -= 1
     
     def _add_congratulatory_email(self, email_template, timestamp):
         """Add a congratulatory email about Calvelli's work"""
-        from datetime import datetime
-        
         # Format time
-        dt = datetime.fromtimestamp(timestamp)
-        time_str = dt.strftime("%I:%M %p")
+        time_str = format_clock_time(timestamp)
         
         email = {
             "subject": email_template["subject"],
@@ -378,21 +600,16 @@ class OutlookWindow(ThemedWindow):
             "blinking": True  # Start blinking
         }
         
-        # Add to beginning (newest first)
-        self.emails.insert(0, email)
-        
-        # Limit to 50 emails
-        if len(self.emails) > 50:
-            self.emails.pop()
+        self._insert_email(email)
     
     def _handle_content_click(self, pos):
         """Handle clicks on email list and email view"""
-        content_y = self.position[1] + self.titlebar_height
-        sidebar_width = 150
+        content_y = self._y + self.titlebar_height
+        sidebar_width = self.sidebar_width
         
         # If viewing an email, check for back button or response clicks
         if self.viewing_email:
-            email_area_x = self.position[0] + sidebar_width + 10
+            email_area_x = self._x + sidebar_width + 10
             email_area_y = content_y + 10
             
             # Back button
@@ -404,28 +621,26 @@ class OutlookWindow(ThemedWindow):
             # Response buttons
             if 'responses' in self.viewing_email:
                 response_start_y = email_area_y + 200  # Approximate
-                for i, response in enumerate(self.viewing_email['responses']):
-                    response_rect = pygame.Rect(email_area_x + 10, response_start_y + i * 35, 
-                                               self.width - sidebar_width - 20, 30)
-                    if response_rect.collidepoint(pos):
-                        # Response clicked (could add functionality here)
-                        self.viewing_email = None  # Close email view after responding
-                        return True
+                if stacked_row_at(pos, (email_area_x + 10, response_start_y), self.width - sidebar_width - 20,
+                                  30, 35, len(self.viewing_email['responses'])) is not None:
+                    # Response clicked (could add functionality here)
+                    self.viewing_email = None  # Close email view after responding
+                    return True
             
             return False
         
         # Otherwise, handle email list clicks
-        list_x = self.position[0] + sidebar_width + 10
+        list_x = self._x + sidebar_width + 10
         list_y = content_y + 10
         
         # Check if click is in email list area
-        if list_x <= pos[0] <= self.position[0] + self.width - 10:
+        if list_x <= pos[0] <= self._x + self.width - 10:
             if list_y <= pos[1] <= content_y + self.height - self.titlebar_height:
                 # Calculate which email was clicked
                 email_index = int((pos[1] - list_y) / 60) + self.scroll_offset
                 if 0 <= email_index < len(self.emails):
                     self.selected_email_index = email_index
-                    self.emails[email_index]['read'] = True
+                    self.mark_read(self.emails[email_index])
                     # Stop blinking if urgent
                     if self.emails[email_index].get('urgent') and self.emails[email_index].get('blinking'):
                         self.emails[email_index]['blinking'] = False
@@ -434,6 +649,54 @@ class OutlookWindow(ThemedWindow):
                     return True
         return False
     
+    def _recalc_layout(self):
+        """Recompute email-list geometry that only depends on the window size"""
+        self._row_width = self.width - self.sidebar_width - 20
+        self._time_x_offset = self._row_width - 60
+        self._urgent_x_offset = self._row_width - 40
+        # Reused for every row background; only its position changes per row
+        self._row_rect = pygame.Rect(0, 0, self._row_width, 55)
+        # Translucent orange overlay for blinking urgent emails
+        # (the startup animation can shrink the window below the sidebar width)
+        self._urgent_overlay = pygame.Surface((max(self._row_width, 0), 55))
+        self._urgent_overlay.set_alpha(100)
+        self._urgent_overlay.fill((255, 165, 0))  # Orange
+        # Scroll arrow triangles, relative to the top/bottom of the email list
+        row_width = self._row_width
+        self._up_arrow_points = ((row_width - 10, 0), (row_width, -5), (row_width + 10, 0))
+        self._down_arrow_points = ((row_width - 10, 0), (row_width, 5), (row_width + 10, 0))
+        # Folder labels with their offsets from the window's top-left corner
+        self._folder_labels = [
+            (render_text(18, folder, (0, 0, 0)), (10, self.titlebar_height + 20 + i * 30))
+            for i, folder in enumerate(["Inbox", "Sent", "Drafts", "Trash"])
+        ]
+        # Offscreen email list covering everything right of the sidebar, below the titlebar,
+        # inside the 2px window border
+        self._list_area = pygame.Rect(self.sidebar_width + 10, self.titlebar_height + 5,
+                                      max(self.width - self.sidebar_width - 12, 0),
+                                      max(self.height - self.titlebar_height - 7, 0))
+        self._list_surface = pygame.Surface(self._list_area.size).convert()
+        self._list_key = None
+        # Everything that only changes with the window size, including the outer border, in one Surface
+        self._chrome_surface = self._compose_chrome()
+        self._layout_size = (self.width, self.height)
+    
+    def _compose_chrome(self):
+        """Bake the background, titlebar, folder sidebar and window border for the current size"""
+        chrome = pygame.Surface((self.width, self.height)).convert()
+        chrome.blit(self.background_surface, (0, 0))
+        if self._titlebar_key != (self.title, self.width):
+            self._compose_titlebar()
+        chrome.blit(self.titlebar_composed, (0, 0))
+        content_height = self.height - self.titlebar_height
+        chrome.fill((240, 240, 240), pygame.Rect(0, self.titlebar_height, self.sidebar_width, content_height))
+        pygame.draw.line(chrome, (200, 200, 200), 
+                        (self.sidebar_width, self.titlebar_height),
+                        (self.sidebar_width, self.titlebar_height + content_height), 2)
+        chrome.blits([(text, offset) for text, offset in self._folder_labels], doreturn=False)
+        pygame.draw.rect(chrome, (180, 180, 180), chrome.get_rect(), 2)
+        return chrome
+    
     def update(self, dt):
         """Update window (for blinking animation and highlight timer)"""
         self.blink_timer += dt
@@ -445,63 +708,81 @@ class OutlookWindow(ThemedWindow):
                 self.highlight_timer = 0
     
     def render(self, screen):
-        screen.blit(self.background_surface, self.position)
-        self.render_titlebar(screen)
-        
-        content_y = self.position[1] + self.titlebar_height
+        content_y = self._y + self.titlebar_height
+        if self._layout_size != (self.width, self.height):
+            self._recalc_layout()
         
-        # Draw folder sidebar
-        sidebar_width = 150
-        pygame.draw.rect(screen, (240, 240, 240), 
-                        pygame.Rect(self.position[0], content_y, sidebar_width, self.height - self.titlebar_height))
-        pygame.draw.line(screen, (200, 200, 200), 
-                        (self.position[0] + sidebar_width, content_y),
-                        (self.position[0] + sidebar_width, content_y + self.height - self.titlebar_height), 2)
-        
-        # Draw folder list
-        font = pygame.font.Font(None, 18)
-        folders = ["Inbox", "Sent", "Drafts", "Trash"]
-        for i, folder in enumerate(folders):
-            text = font.render(folder, True, (0, 0, 0))
-            screen.blit(text, (self.position[0] + 10, content_y + 20 + i * 30))
+        # Background, titlebar, folder sidebar and border come pre-composed
+        screen.blit(self._chrome_surface, self.position)
         
         # Draw inbox count
-        unread_count = sum(1 for email in self.emails if not email.get('read', False))
-        if unread_count > 0:
-            count_text = font.render(f"({unread_count})", True, (0, 120, 212))
-            screen.blit(count_text, (self.position[0] + 80, content_y + 20))
+        if self.unread_count > 0:
+            count_text = render_text(18, f"({self.unread_count})", (0, 120, 212))
+            screen.blit(count_text, (self._x + 80, content_y + 20))
         
         # Note: Email viewing is now done in separate windows, so we don't render inline view
         
-        # Draw email list
-        list_x = self.position[0] + sidebar_width + 10
-        list_y = content_y + 10
-        font_small = pygame.font.Font(None, 14)
-        font_subject = pygame.font.Font(None, 16)
-        
+        # Draw email list (composed offscreen, redrawn only when a visible row changes)
+        blink_on = int(self.blink_timer / 500) % 2 == 0  # Blink every 500ms
+        list_key = self._email_list_key(blink_on)
+        area = self._list_area
+        if list_key != self._list_key:
+            self._list_surface.blit(self._chrome_surface, (-area.x, -area.y))
+            # The list starts 10px right of the sidebar and 10px below the titlebar
+            self._draw_email_list(self._list_surface, 0, 5, blink_on)
+            self._list_key = list_key
+        screen.blit(self._list_surface, (self._x + area.x, self._y + area.y))
+    
+    def _visible_emails(self):
+        """The emails currently scrolled into view, as a list"""
+        return list(itertools.islice(self.emails, self.scroll_offset, self.scroll_offset + self.max_visible_emails))
+    
+    def _email_list_key(self, blink_on):
+        """Summarize everything the visible part of the email list depends on"""
+        rows = []
+        for i, email in enumerate(self._visible_emails()):
+            email_index = self.scroll_offset + i
+            if self.highlighted_email_index == email_index:
+                highlight = self.highlight_timer
+            else:
+                highlight = None
+            rows.append((
+                email['subject'], email['from'], email['time'],
+                email.get('read', False), email.get('replied', False),
+                email.get('urgent', False) and email.get('blinking', False) and blink_on,
+                email_index == self.selected_email_index, highlight
+            ))
+        has_more = self.scroll_offset + self.max_visible_emails < len(self.emails)
+        return (self.scroll_offset, has_more, tuple(rows))
+    
+    def _draw_email_list(self, surface, list_x, list_y, blink_on):
+        """Draw the visible email rows and scroll arrows with the list's top-left at (list_x, list_y)"""
         # Show visible emails based on scroll
-        visible_emails = self.emails[self.scroll_offset:self.scroll_offset + self.max_visible_emails]
+        visible_emails = self._visible_emails()
+        # Row text is collected and blitted in one batch after the row backgrounds
+        text_blits = []
+        row_rect = self._row_rect
+        time_x = list_x + self._time_x_offset
+        urgent_x = list_x + self._urgent_x_offset
         
         for i, email in enumerate(visible_emails):
             email_y = list_y + i * 60
             email_index = self.scroll_offset + i
             
             # Highlight clicked email (temporary darkening) - draw first so other highlights can overlay
+            row_rect.topleft = (list_x, email_y)
             if self.highlighted_email_index == email_index:
-                highlight_rect = pygame.Rect(list_x, email_y, self.width - sidebar_width - 20, 55)
                 # Calculate fade (darker at start, lighter over time)
                 fade_progress = min(self.highlight_timer / 2000.0, 1.0)  # 2000ms = 2 seconds
                 highlight_alpha = int(100 * (1.0 - fade_progress))  # Fade from 100 to 0
                 highlight_color = (200 - highlight_alpha, 200 - highlight_alpha, 200 - highlight_alpha)
-                pygame.draw.rect(screen, highlight_color, highlight_rect)
+                surface.fill(highlight_color, row_rect)
             
             # Highlight selected email
             if email_index == self.selected_email_index:
-                pygame.draw.rect(screen, (220, 235, 255), 
-                               pygame.Rect(list_x, email_y, self.width - sidebar_width - 20, 55))
+                surface.fill((220, 235, 255), row_rect)
             elif i % 2 == 0:
-                pygame.draw.rect(screen, (250, 250, 250), 
-                               pygame.Rect(list_x, email_y, self.width - sidebar_width - 20, 55))
+                surface.fill((250, 250, 250), row_rect)
             
             # Reply indicator (small arrow icon in top left)
             if email.get('replied', False):
@@ -510,7 +791,7 @@ class OutlookWindow(ThemedWindow):
                 reply_icon_x = list_x + 5
                 reply_icon_y = email_y + 5
                 # Simple arrow shape pointing right
-                pygame.draw.polygon(screen, (100, 150, 100), [
+                pygame.draw.polygon(surface, (100, 150, 100), [
                     (reply_icon_x, reply_icon_y),
                     (reply_icon_x + reply_icon_size, reply_icon_y + reply_icon_size // 2),
                     (reply_icon_x, reply_icon_y + reply_icon_size)
@@ -519,88 +800,72 @@ class OutlookWindow(ThemedWindow):
             # Unread indicator (blue dot) - offset if reply icon is present
             unread_dot_x = list_x + 8 if not email.get('replied', False) else list_x + 20
             if not email.get('read', False):
-                pygame.draw.circle(screen, (0, 120, 212), (unread_dot_x, email_y + 27), 4)
+                pygame.draw.circle(surface, (0, 120, 212), (unread_dot_x, email_y + 27), 4)
             
             # URGENT indicator (orange, blinking)
             if email.get('urgent', False):
-                # Blinking animation
-                blink_on = int(self.blink_timer / 500) % 2 == 0  # Blink every 500ms
                 if email.get('blinking', False) and blink_on:
                     # Draw orange highlight
-                    urgent_rect = pygame.Rect(list_x, email_y, self.width - sidebar_width - 20, 55)
-                    urgent_surface = pygame.Surface((urgent_rect.width, urgent_rect.height))
-                    urgent_surface.set_alpha(100)
-                    urgent_surface.fill((255, 165, 0))  # Orange
-                    screen.blit(urgent_surface, urgent_rect.topleft)
+                    surface.blit(self._urgent_overlay, row_rect.topleft)
                     
                     # Draw URGENT label
-                    urgent_font = pygame.font.Font(None, 12)
-                    urgent_text = urgent_font.render("URGENT", True, (255, 100, 0))
-                    screen.blit(urgent_text, (list_x + self.width - sidebar_width - 60, email_y + 35))
+                    urgent_text = render_text(12, "URGENT", (255, 100, 0))
+                    text_blits.append((urgent_text, (urgent_x, email_y + 35)))
             
             # Subject - offset if reply icon is present
             subject_x = list_x + 15 if not email.get('replied', False) else list_x + 25
             subject_color = (0, 0, 0) if email.get('read', False) else (0, 0, 0)
-            subject_text = font_subject.render(email['subject'], True, subject_color)
-            screen.blit(subject_text, (subject_x, email_y + 5))
+            subject_text = render_text(16, email['subject'], subject_color)
+            text_blits.append((subject_text, (subject_x, email_y + 5)))
             
             # From
-            from_text = font_small.render(email['from'], True, (100, 100, 100))
-            screen.blit(from_text, (list_x + 15, email_y + 25))
+            from_text = render_text(14, email['from'], (100, 100, 100))
+            text_blits.append((from_text, (list_x + 15, email_y + 25)))
             
             # Time
-            time_text = font_small.render(email['time'], True, (150, 150, 150))
-            screen.blit(time_text, (list_x + self.width - sidebar_width - 80, email_y + 5))
+            time_text = render_text(14, email['time'], (150, 150, 150))
+            text_blits.append((time_text, (time_x, email_y + 5)))
+        
+        surface.blits(text_blits, doreturn=False)
         
         # Scroll indicators
         if self.scroll_offset > 0:
             # Up arrow
-            pygame.draw.polygon(screen, (150, 150, 150), 
-                              [(list_x + self.width - sidebar_width - 30, list_y),
-                               (list_x + self.width - sidebar_width - 20, list_y - 5),
-                               (list_x + self.width - sidebar_width - 10, list_y)])
+            pygame.draw.polygon(surface, (150, 150, 150),
+                                [(list_x + dx, list_y + dy) for dx, dy in self._up_arrow_points])
         
         if self.scroll_offset + self.max_visible_emails < len(self.emails):
             # Down arrow
             bottom_y = list_y + self.max_visible_emails * 60
-            pygame.draw.polygon(screen, (150, 150, 150), 
-                              [(list_x + self.width - sidebar_width - 30, bottom_y),
-                               (list_x + self.width - sidebar_width - 20, bottom_y + 5),
-                               (list_x + self.width - sidebar_width - 10, bottom_y)])
-        
-        
-        pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+            pygame.draw.polygon(surface, (150, 150, 150),
+                                [(list_x + dx, bottom_y + dy) for dx, dy in self._down_arrow_points])
     
     def _render_email_view(self, screen, content_y, sidebar_width):
         """Render the full email view with message and response options"""
         # Draw email content area
-        email_area_x = self.position[0] + sidebar_width + 10
+        email_area_x = self._x + sidebar_width + 10
         email_area_y = content_y + 10
         email_area_width = self.width - sidebar_width - 20
         
         # Background for email view
-        pygame.draw.rect(screen, (255, 255, 255), 
+        screen.fill((255, 255, 255), 
                         pygame.Rect(email_area_x, email_area_y, email_area_width, 
                                    self.height - self.titlebar_height - 20))
         
         # Back button
-        back_font = pygame.font.Font(None, 16)
-        back_text = back_font.render("← Back to Inbox", True, (0, 120, 212))
+        back_text = render_text(16, "← Back to Inbox", (0, 120, 212))
         screen.blit(back_text, (email_area_x + 10, email_area_y + 10))
         
         # Email header
         header_y = email_area_y + 40
-        font_subject = pygame.font.Font(None, 20)
-        font_sender = pygame.font.Font(None, 16)
         
-        subject_text = font_subject.render(self.viewing_email['subject'], True, (0, 0, 0))
+        subject_text = render_text(20, self.viewing_email['subject'], (0, 0, 0))
         screen.blit(subject_text, (email_area_x + 10, header_y))
         
-        from_text = font_sender.render(f"From: {self.viewing_email['from']}", True, (100, 100, 100))
+        from_text = render_text(16, f"From: {self.viewing_email['from']}", (100, 100, 100))
         screen.blit(from_text, (email_area_x + 10, header_y + 25))
         
-        time_text = font_sender.render(f"Time: {self.viewing_email['time']}", True, (100, 100, 100))
+        time_text = render_text(16, f"Time: {self.viewing_email['time']}", (100, 100, 100))
         screen.blit(time_text, (email_area_x + 10, header_y + 45))
         
         # Divider
@@ -610,46 +875,27 @@ class OutlookWindow(ThemedWindow):
         
         # Email message
         message_y = header_y + 85
-        font_message = pygame.font.Font(None, 16)
-        # Wrap message text
-        message = self.viewing_email['message']
-        words = message.split(' ')
-        lines = []
-        current_line = ""
-        max_width = email_area_width - 40
-        
-        for word in words:
-            test_line = current_line + word + " " if current_line else word + " "
-            if font_message.size(test_line)[0] < max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line.strip())
-                current_line = word + " "
-        if current_line:
-            lines.append(current_line.strip())
+        # Wrap message text (cached per message and width)
+        lines = wrap_text(self.viewing_email['message'], 16, email_area_width - 40)
         
         for i, line in enumerate(lines[:15]):  # Max 15 lines
-            line_text = font_message.render(line, True, (0, 0, 0))
+            line_text = render_text(16, line, (0, 0, 0))
             screen.blit(line_text, (email_area_x + 20, message_y + i * 20))
         
         # Response options
         if 'responses' in self.viewing_email:
             response_y = message_y + len(lines) * 20 + 30
-            response_label = font_subject.render("Quick Reply:", True, (0, 0, 0))
+            response_label = render_text(20, "Quick Reply:", (0, 0, 0))
             screen.blit(response_label, (email_area_x + 10, response_y))
             
             response_y += 30
-            for i, response in enumerate(self.viewing_email['responses']):
-                response_rect = pygame.Rect(email_area_x + 10, response_y + i * 35, 
-                                           email_area_width - 20, 30)
-                # Hover effect could be added here
-                pygame.draw.rect(screen, (240, 240, 240), response_rect)
-                pygame.draw.rect(screen, (200, 200, 200), response_rect, 1)
-                
-                response_text = font_message.render(response, True, (0, 0, 0))
-                text_rect = response_text.get_rect(center=response_rect.center)
-                screen.blit(response_text, text_rect)
+            # The buttons only change with the email and the area width, so draw them as one panel
+            panel_key = (tuple(self.viewing_email['responses']), email_area_width)
+            if panel_key != self._response_panel_key:
+                self._response_panel = build_option_panel(self.viewing_email['responses'], email_area_width - 20,
+                                                          30, 35, 16, (240, 240, 240), (200, 200, 200), (0, 0, 0))
+                self._response_panel_key = panel_key
+            screen.blit(self._response_panel, (email_area_x + 10, response_y))
 
 
 class MessagesWindow(ThemedWindow):
@@ -658,8 +904,20 @@ class MessagesWindow(ThemedWindow):
         super().__init__("Messages", position, width, height, assets_path, z_index)
         self.background_surface.fill((255, 255, 255))
         
+        # Contact list sidebar never changes, so it is drawn into the background once
+        self.sidebar_width = 200
+        content_height = self.height - self.titlebar_height
+        self.background_surface.fill((245, 245, 245),
+                        pygame.Rect(0, self.titlebar_height, self.sidebar_width, content_height))
+        pygame.draw.line(self.background_surface, (220, 220, 220),
+                        (self.sidebar_width, self.titlebar_height),
+                        (self.sidebar_width, self.titlebar_height + content_height), 2)
+        
         # Start with empty conversations
         self.conversations = {}
+        # Sidebar preview text per contact, kept in step with each conversation's last message
+        self._contact_previews = {}
+        self.contacts = []  # Contact names in sidebar order (insertion order of conversations)
         self.conversation_replied = {}  # Track which conversations have been replied to
         self.selected_contact = None
         self.sidebar_width = 200
@@ -671,77 +929,100 @@ class MessagesWindow(ThemedWindow):
         self.current_letter_index = 0
         self.is_reply_complete = False
         self.reply_options = ["Okay", "Got it", "Thanks", "Will do", "Sure thing"]
+        # The options never change, so their buttons are drawn once and blitted as a single panel
+        self._reply_panel = build_option_panel(self.reply_options, 200, 30, 35, 18, (240, 240, 240), (200, 200, 200), (0, 0, 0))
         self.selected_reply_option = None
+        # Send button in each (reply complete, pressed) state, drawn once and picked per draw
+        self._send_buttons = {
+            (complete, pressed): build_button("Send", 100, 40, 16, darken(base_color, 30) if pressed else base_color,
+                                              (100, 100, 100), (255, 255, 255))
+            for complete, base_color in ((True, (0, 180, 0)), (False, (150, 150, 150)))
+            for pressed in (False, True)
+        }
+        # Reply/option/send button rects relative to the window, laid out for this window size
+        self._button_layout_size = None
+        
+        # Message bubbles are all 300x40, so each style is drawn once and blitted per message
+        self._bubble_received = pygame.Surface((300, 40))
+        self._bubble_received.fill((230, 230, 230))
+        pygame.draw.rect(self._bubble_received, (200, 200, 200), self._bubble_received.get_rect(), 1)
+        self._bubble_sent = pygame.Surface((300, 40))
+        self._bubble_sent.fill((0, 120, 255))
         # Events to report back to the game (e.g., for progress updates)
         self.sent_reply_events = []
         # Track pressed state for buttons (reply/send) so actions happen on release
         self._reply_button_pressed = False
         self._send_button_pressed = False
     
+    def _layout_buttons(self):
+        """Compute the reply, option and send button rects relative to the window's top-left corner
+        
+        Only recomputed when the window size changes (the startup animation resizes windows).
+        """
+        size = (self.width, self.height)
+        if size == self._button_layout_size:
+            return
+        reply_area_y = self.height - 90
+        msg_x = self.sidebar_width + 10
+        self._reply_button_rect = pygame.Rect(msg_x, reply_area_y, 100, 30)
+        self._options_top_left = (msg_x, reply_area_y - 130)
+        self._option_rects = [pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
+                              for i in range(len(self.reply_options))]
+        self._send_button_rect = pygame.Rect(self.width - 110, reply_area_y - 50, 100, 40)
+        self._button_layout_size = size
+    
     def add_message(self, contact, message):
         """Add a message from a contact"""
+        self.mark_dirty()
         if contact not in self.conversations:
             self.conversations[contact] = []
+            self.contacts.append(contact)
         self.conversations[contact].append(message)
+        self._contact_previews[contact] = message[:30] + "..."
         # Auto-select the contact if none selected
         if self.selected_contact is None:
             self.selected_contact = contact
     
     def _handle_content_click(self, pos):
         """Handle clicks on contact list and reply button"""
-        content_y = self.position[1] + self.titlebar_height
+        self.mark_dirty()
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
+        content_y = self._y + self.titlebar_height
         # Check if click is in sidebar
-        if self.position[0] <= pos[0] <= self.position[0] + self.sidebar_width:
-            contacts = list(self.conversations.keys())
-            for i, contact in enumerate(contacts):
-                contact_y = content_y + 10 + i * 50
-                if content_y + 10 + i * 50 <= pos[1] <= content_y + 10 + (i + 1) * 50:
-                    self.selected_contact = contact
+        if self._x <= pos[0] <= self._x + self.sidebar_width:
+            # Rows are 50px tall; a click on the line between two rows selects the upper one
+            offset = pos[1] - (content_y + 10)
+            if offset >= 0:
+                index = max(offset - 1, 0) // 50
+                if index < len(self.contacts):
+                    self.selected_contact = self.contacts[index]
                     return True
         
         # Check reply button (if contact is selected and not already replied)
         if (self.selected_contact and not self.replying and 
             not self.conversation_replied.get(self.selected_contact, False)):
-            reply_button_y = self.position[1] + self.height - 80
-            reply_button_rect = pygame.Rect(
-                self.position[0] + self.sidebar_width + 10,
-                reply_button_y,
-                100,
-                30
-            )
-            if reply_button_rect.collidepoint(pos):
+            if self._reply_button_rect.collidepoint(local_pos):
                 # Mark reply button as pressed; actual state change happens on release
                 self._reply_button_pressed = True
                 return True
         
         # Check reply option buttons
         if self.replying and self.selected_reply_option is None:
-            reply_options_y = self.position[1] + self.height - 200
-            for i, option in enumerate(self.reply_options):
-                option_rect = pygame.Rect(
-                    self.position[0] + self.sidebar_width + 10,
-                    reply_options_y + i * 35,
-                    200,
-                    30
-                )
-                if option_rect.collidepoint(pos):
-                    self.selected_reply_option = option
-                    self.target_reply = option
-                    self.reply_text = ""
-                    self.current_letter_index = 0
-                    self.is_reply_complete = False
-                    return True
+            # Options are 30px tall on a 35px pitch, so the row index is plain arithmetic
+            index = stacked_row_at(local_pos, self._options_top_left, 200, 30, 35, len(self.reply_options))
+            if index is not None:
+                option = self.reply_options[index]
+                self.selected_reply_option = option
+                self.target_reply = option
+                self.reply_text = ""
+                self.current_letter_index = 0
+                self.is_reply_complete = False
+                return True
         
         # Check send button
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            send_button_rect = pygame.Rect(
-                self.position[0] + self.width - 110,
-                reply_area_y - 50,
-                100,
-                40
-            )
-            if send_button_rect.collidepoint(pos):
+            if self._send_button_rect.collidepoint(local_pos):
                 # Mark send as pressed; actual send happens on release
                 self._send_button_pressed = True
                 return True
@@ -750,21 +1031,16 @@ class MessagesWindow(ThemedWindow):
     
     def handle_release(self, pos):
         """Handle mouse release - trigger button actions after visual feedback."""
+        self.mark_dirty()
         super().handle_release(pos)
         
-        content_y = self.position[1] + self.titlebar_height
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
         
         # Handle reply button release
         if (self.selected_contact and not self.replying and 
             not self.conversation_replied.get(self.selected_contact, False)):
-            reply_button_y = self.position[1] + self.height - 80
-            reply_button_rect = pygame.Rect(
-                self.position[0] + self.sidebar_width + 10,
-                reply_button_y,
-                100,
-                30
-            )
-            if self._reply_button_pressed and reply_button_rect.collidepoint(pos):
+            if self._reply_button_pressed and self._reply_button_rect.collidepoint(local_pos):
                 self.replying = True
                 self.selected_reply_option = None
                 self.reply_text = ""
@@ -775,18 +1051,12 @@ class MessagesWindow(ThemedWindow):
         
         # Handle send button release
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            send_button_rect = pygame.Rect(
-                self.position[0] + self.width - 110,
-                reply_area_y - 50,
-                100,
-                40
-            )
-            if self._send_button_pressed and send_button_rect.collidepoint(pos):
+            if self._send_button_pressed and self._send_button_rect.collidepoint(local_pos):
                 if self.selected_contact:
                     if len(self.conversations[self.selected_contact]) % 2 == 0:
                         self.conversations[self.selected_contact].append("")
                     self.conversations[self.selected_contact].append(self.reply_text)
+                    self._contact_previews[self.selected_contact] = self.reply_text[:30] + "..."
                     self.conversation_replied[self.selected_contact] = True
                     self.sent_reply_events.append("You replied in Messages")
                 self.replying = False
@@ -808,8 +1078,10 @@ class MessagesWindow(ThemedWindow):
         # Check if we have more letters to type
         if self.current_letter_index < len(self.target_reply):
             # Add next letter
-            self.reply_text += self.target_reply[self.current_letter_index]
             self.current_letter_index += 1
+            self.reply_text = self.target_reply[:self.current_letter_index]
+            # Only the typing box and send button change while typing
+            self.mark_region_dirty()
             
             # Check if complete
             if self.current_letter_index >= len(self.target_reply):
@@ -818,157 +1090,156 @@ class MessagesWindow(ThemedWindow):
         return False
     
     def render(self, screen):
-        screen.blit(self.background_surface, self.position)
+        self._track_mouse_press()
+        self._render_cached(screen)
+    
+    def _draw_reply_options(self, screen):
+        """Draw the "Select a reply" label and the reply option buttons"""
+        x, y = self._x, self._y
+        reply_area_y = y + self.height - 90
+        msg_x = x + self.sidebar_width + 10
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        label_text = render_text(18, "Select a reply:", (0, 0, 0))
+        screen.blit(label_text, (msg_x, reply_area_y - 150))
+        
+        options_x, options_y = self._options_top_left
+        screen.blit(self._reply_panel, (x + options_x, y + options_y))
+        # Only the option under a held mouse button is redrawn, in its pressed colour
+        if mouse_buttons[0]:
+            pressed = stacked_row_at((mouse_pos[0] - x, mouse_pos[1] - y), self._options_top_left,
+                                     200, 30, 35, len(self.reply_options))
+            if pressed is not None:
+                draw_option_button(screen, self._option_rects[pressed].move(x, y), self.reply_options[pressed],
+                                   18, (220, 220, 220), (200, 200, 200), (0, 0, 0))
+    
+    def _draw_typing_area(self, screen):
+        """Draw the reply typing box and send button (also redrawn alone after a keypress)"""
+        reply_area_y = self._y + self.height - 90
+        msg_x = self._x + self.sidebar_width + 10
+        sidebar_width = self.sidebar_width
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
+        screen.fill((255, 255, 255), typing_box)
+        pygame.draw.rect(screen, (200, 200, 200), typing_box, 1)
+        
+        # Draw typed text
+        typed_text = render_text(16, self.reply_text, (0, 0, 0))
+        screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
+        
+        # Draw remaining text (grayed out)
+        if not self.is_reply_complete:
+            remaining = self.target_reply[self.current_letter_index:]
+            remaining_text = render_text(16, remaining, (200, 200, 200))
+            screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
+        
+        # Draw send button with press feedback
+        send_button_rect = self._send_button_rect.move(self._x, self._y)
+        pressed = bool(mouse_buttons[0] and send_button_rect.collidepoint(mouse_pos))
+        screen.blit(self._send_buttons[self.is_reply_complete, pressed], send_button_rect)
+    
+    def _draw_dirty_region(self, screen):
+        self._draw_typing_area(screen)
+    
+    def _draw_window(self, screen):
+        self._layout_buttons()
+        # Window origin, bound once for the per-row arithmetic below
+        x, y = self._x, self._y
+        screen.blit(self.background_surface, (x, y))
         self.render_titlebar(screen)
         
-        content_y = self.position[1] + self.titlebar_height
+        content_y = y + self.titlebar_height
         
-        # Draw contact list sidebar
-        sidebar_width = 200
-        pygame.draw.rect(screen, (245, 245, 245), 
-                        pygame.Rect(self.position[0], content_y, sidebar_width, self.height - self.titlebar_height))
-        pygame.draw.line(screen, (220, 220, 220), 
-                        (self.position[0] + sidebar_width, content_y),
-                        (self.position[0] + sidebar_width, content_y + self.height - self.titlebar_height), 2)
+        # Contact list sidebar background comes with background_surface
+        sidebar_width = self.sidebar_width
         
-        # Draw contact list
-        font = pygame.font.Font(None, 20)
-        contacts = list(self.conversations.keys())
-        for i, contact in enumerate(contacts):
+        # Draw contact list; names and previews are blitted in one batch after the highlight
+        selected_contact = self.selected_contact
+        text_blits = []
+        for i, contact in enumerate(self.contacts):
             contact_y = content_y + 10 + i * 50
             # Highlight selected
-            if contact == self.selected_contact:
-                pygame.draw.rect(screen, (200, 220, 255), 
-                               pygame.Rect(self.position[0] + 5, contact_y, sidebar_width - 10, 45))
+            if contact == selected_contact:
+                screen.fill((200, 220, 255), 
+                               pygame.Rect(x + 5, contact_y, sidebar_width - 10, 45))
             
             # Contact name
-            name_text = font.render(contact, True, (0, 0, 0))
-            screen.blit(name_text, (self.position[0] + 15, contact_y + 10))
+            name_text = render_text(20, contact, (0, 0, 0))
+            text_blits.append((name_text, (x + 15, contact_y + 10)))
             
             # Preview (if there are messages)
-            if contact in self.conversations and len(self.conversations[contact]) > 0:
-                preview_font = pygame.font.Font(None, 14)
-                preview = self.conversations[contact][-1][:30] + "..."
-                preview_text = preview_font.render(preview, True, (120, 120, 120))
-                screen.blit(preview_text, (self.position[0] + 15, contact_y + 30))
+            preview = self._contact_previews.get(contact)
+            if preview is not None:
+                preview_text = render_text(14, preview, (120, 120, 120))
+                text_blits.append((preview_text, (x + 15, contact_y + 30)))
+        screen.blits(text_blits, doreturn=False)
         
         # Draw message area
-        msg_x = self.position[0] + sidebar_width + 10
+        msg_x = x + sidebar_width + 10
         msg_y = content_y + 10
         msg_area_height = self.height - self.titlebar_height - 100  # Leave space for reply area
         
         # Draw messages (only if a contact is selected)
         if self.selected_contact and self.selected_contact in self.conversations:
-            font_msg = pygame.font.Font(None, 18)
             messages = self.conversations[self.selected_contact]
-            visible_index = 0  # Track visible message index for positioning
-            for i, msg in enumerate(messages):
-                # Skip empty messages (they're just placeholders for alignment)
-                if not msg:
-                    continue
-                
+            # Rows are 50px apart; only as many as start inside the message area are drawn
+            max_visible = max((msg_area_height - 10) // 50 + 1, 0)
+            # Empty messages are just placeholders for alignment and take no row
+            shown = itertools.islice(((i, msg) for i, msg in enumerate(messages) if msg), max_visible)
+            sent_x = x + self.width - 320
+            # Bubbles and their text in draw order, blitted in one batch
+            bubble_blits = []
+            for visible_index, (i, msg) in enumerate(shown):
                 msg_y_pos = msg_y + visible_index * 50
-                if msg_y_pos > content_y + msg_area_height:
-                    break  # Don't draw outside message area
                 
                 # Message bubble (alternate sides based on original index)
                 if i % 2 == 0:
                     # Received (gray, left)
-                    bubble_rect = pygame.Rect(msg_x, msg_y_pos, 300, 40)
-                    pygame.draw.rect(screen, (230, 230, 230), bubble_rect)
-                    pygame.draw.rect(screen, (200, 200, 200), bubble_rect, 1)
-                    msg_text = font_msg.render(msg, True, (0, 0, 0))
-                    text_rect = msg_text.get_rect(center=bubble_rect.center)
-                    screen.blit(msg_text, text_rect)
+                    bubble_x = msg_x
+                    bubble = self._bubble_received
+                    msg_text = render_text(18, msg, (0, 0, 0))
                 else:
                     # Sent (blue, right)
-                    bubble_rect = pygame.Rect(self.position[0] + self.width - 320, msg_y_pos, 300, 40)
-                    pygame.draw.rect(screen, (0, 120, 255), bubble_rect)
-                    msg_text = font_msg.render(msg, True, (255, 255, 255))
-                    text_rect = msg_text.get_rect(center=bubble_rect.center)
-                    screen.blit(msg_text, text_rect)
-                
-                visible_index += 1
+                    bubble_x = sent_x
+                    bubble = self._bubble_sent
+                    msg_text = render_text(18, msg, (255, 255, 255))
+                bubble_blits.append((bubble, (bubble_x, msg_y_pos)))
+                # Centre the text on the 300x40 bubble
+                bubble_blits.append((msg_text, (bubble_x + 150 - msg_text.get_width() // 2,
+                                                msg_y_pos + 20 - msg_text.get_height() // 2)))
+            screen.blits(bubble_blits, doreturn=False)
         elif not self.conversations:
             # Show empty state
-            font_empty = pygame.font.Font(None, 24)
-            empty_text = font_empty.render("No messages", True, (150, 150, 150))
-            text_rect = empty_text.get_rect(center=(self.position[0] + self.width // 2, 
-                                                    self.position[1] + self.height // 2))
-            screen.blit(empty_text, text_rect)
+            empty_text = render_text(24, "No messages", (150, 150, 150))
+            blit_centered(screen, empty_text, (x + self.width // 2, y + self.height // 2))
         
         # Draw reply area (if contact is selected)
         if self.selected_contact:
-            reply_area_y = self.position[1] + self.height - 90
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = self._mouse_pos()
             mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
             
-            if self.replying:
-                # Draw reply options if none selected
-                if self.selected_reply_option is None:
-                    font_label = pygame.font.Font(None, 18)
-                    label_text = font_label.render("Select a reply:", True, (0, 0, 0))
-                    screen.blit(label_text, (msg_x, reply_area_y - 150))
-                    
-                    for i, option in enumerate(self.reply_options):
-                        option_rect = pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
-                        base_color = (240, 240, 240)
-                        if option_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                            draw_color = (220, 220, 220)
-                        else:
-                            draw_color = base_color
-                        pygame.draw.rect(screen, draw_color, option_rect)
-                        pygame.draw.rect(screen, (200, 200, 200), option_rect, 1)
-                        option_text = font_msg.render(option, True, (0, 0, 0))
-                        text_rect = option_text.get_rect(center=option_rect.center)
-                        screen.blit(option_text, text_rect)
-                else:
-                    # Draw typing area
-                    typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
-                    pygame.draw.rect(screen, (255, 255, 255), typing_box)
-                    pygame.draw.rect(screen, (200, 200, 200), typing_box, 1)
-                    
-                    # Draw typed text
-                    font_typing = pygame.font.Font(None, 16)
-                    typed_text = font_typing.render(self.reply_text, True, (0, 0, 0))
-                    screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
-                    
-                    # Draw remaining text (grayed out)
-                    if not self.is_reply_complete:
-                        remaining = self.target_reply[self.current_letter_index:]
-                        remaining_text = font_typing.render(remaining, True, (200, 200, 200))
-                        screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
-                    
-                    # Draw send button with press feedback
-                    send_button_rect = pygame.Rect(self.position[0] + self.width - 110, reply_area_y - 50, 100, 40)
-                    base_color = (0, 180, 0) if self.is_reply_complete else (150, 150, 150)
-                    if send_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                        send_color = tuple(max(0, c - 30) for c in base_color)
-                    else:
-                        send_color = base_color
-                    pygame.draw.rect(screen, send_color, send_button_rect)
-                    pygame.draw.rect(screen, (100, 100, 100), send_button_rect, 1)
-                    font_button = pygame.font.Font(None, 16)
-                    send_text = font_button.render("Send", True, (255, 255, 255))
-                    text_rect = send_text.get_rect(center=send_button_rect.center)
-                    screen.blit(send_text, text_rect)
-            else:
+            if not self.replying:
                 # Draw reply button (only if not already replied)
                 if not self.conversation_replied.get(self.selected_contact, False):
-                    reply_button_rect = pygame.Rect(msg_x, reply_area_y, 100, 30)
+                    reply_button_rect = self._reply_button_rect.move(x, y)
                     base_color = (0, 120, 255)
                     if reply_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
                         draw_color = (0, 90, 210)
                     else:
                         draw_color = base_color
-                    pygame.draw.rect(screen, draw_color, reply_button_rect)
-                    font_button = pygame.font.Font(None, 16)
-                    reply_button_text = font_button.render("Reply", True, (255, 255, 255))
-                    text_rect = reply_button_text.get_rect(center=reply_button_rect.center)
-                    screen.blit(reply_button_text, text_rect)
+                    screen.fill(draw_color, reply_button_rect)
+                    reply_button_text = render_text(16, "Reply", (255, 255, 255))
+                    blit_centered(screen, reply_button_text, reply_button_rect.center)
+            elif self.selected_reply_option is None:
+                self._draw_reply_options(screen)
+            else:
+                self._draw_typing_area(screen)
         
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(x, y, self.width, self.height), 2)
 
 
 class SlackWindow(ThemedWindow):
@@ -977,13 +1248,27 @@ class SlackWindow(ThemedWindow):
         super().__init__("Slack", position, width, height, assets_path, z_index)
         self.background_surface.fill((255, 255, 255))
         
+        # Channel sidebar never changes, so it is drawn into the background once
+        self.sidebar_width = 180
+        self.background_surface.fill((60, 60, 60),
+                        pygame.Rect(0, self.titlebar_height, self.sidebar_width, self.height - self.titlebar_height))
+        
+        # User list panel, rebuilt only when the channel or window size changes
+        self._user_panel = None
+        self._user_panel_key = None
+        
         self.channels = ["# general", "# conference-planning", "# fundraising", "# random"]
-        # Start with empty messages
-        self.messages = []
+        # Channel names sit on the static sidebar too; only the selected row is redrawn over its highlight
+        self.background_surface.blits([(render_text(18, channel, (200, 200, 200)), (10, self.titlebar_height + 25 + i * 35))
+                                       for i, channel in enumerate(self.channels)], doreturn=False)
+        # Highlight row of each channel, relative to the window
+        self._channel_rects = {channel: pygame.Rect(5, self.titlebar_height + 20 + i * 35, self.sidebar_width - 10, 30)
+                               for i, channel in enumerate(self.channels)}
+        # Start with empty messages, kept in one list per channel
+        self.messages_by_channel = {channel: [] for channel in self.channels}
         self.selected_channel = "# general"
         
         # Channel users (always calvelli and matt, plus 1-3 extra)
-        import random
         extra_users = ["seong-ah", "jar", "halle", "fleece", "anne", "michael miske", "manon", "julian"]
         self.channel_users = {
             "# general": ["calvelli", "matt"] + random.sample(extra_users, random.randint(1, 3)),
@@ -1004,73 +1289,82 @@ class SlackWindow(ThemedWindow):
         self.current_letter_index = 0
         self.is_reply_complete = False
         self.reply_options = ["Okay", "Got it", "Thanks", "Will do", "Sure thing"]
+        # The options never change, so their buttons are drawn once and blitted as a single panel
+        self._reply_panel = build_option_panel(self.reply_options, 200, 30, 35, 16, (240, 240, 240), (200, 200, 200), (0, 0, 0))
         self.selected_reply_option = None
+        # Send button in each (reply complete, pressed) state, drawn once and picked per draw
+        self._send_buttons = {
+            (complete, pressed): build_button("Send", 100, 40, 16, darken(base_color, 30) if pressed else base_color,
+                                              (100, 100, 100), (255, 255, 255))
+            for complete, base_color in ((True, (0, 180, 0)), (False, (150, 150, 150)))
+            for pressed in (False, True)
+        }
+        # Reply/option/send button rects relative to the window, laid out for this window size
+        self._button_layout_size = None
+    
+    def _layout_buttons(self):
+        """Compute the reply, option and send button rects relative to the window's top-left corner
+        
+        Only recomputed when the window size changes (the startup animation resizes windows).
+        """
+        size = (self.width, self.height)
+        if size == self._button_layout_size:
+            return
+        reply_area_y = self.height - 90
+        msg_x = self.sidebar_width + 10
+        self._reply_button_rect = pygame.Rect(msg_x, reply_area_y + 10, 100, 30)
+        self._options_top_left = (msg_x, reply_area_y - 130)
+        self._option_rects = [pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
+                              for i in range(len(self.reply_options))]
+        self._send_button_rect = pygame.Rect(msg_x, reply_area_y - 5, 100, 40)
+        self._button_layout_size = size
     
     def add_message(self, channel, user, text):
         """Add a message to a channel"""
-        self.messages.append({"channel": channel, "user": user, "text": text})
+        self.mark_dirty()
+        self.messages_by_channel.setdefault(channel, []).append({"channel": channel, "user": user, "text": text})
         # Auto-select the channel if it's not already selected
         if self.selected_channel != channel:
             self.selected_channel = channel
     
     def _handle_content_click(self, pos):
         """Handle clicks on channels and reply button"""
-        content_y = self.position[1] + self.titlebar_height
-        
-        # Check if click is in channel sidebar
-        sidebar_width = 180
-        if self.position[0] <= pos[0] <= self.position[0] + sidebar_width:
-            for i, channel in enumerate(self.channels):
-                channel_y = content_y + 20 + i * 35
-                if channel_y <= pos[1] <= channel_y + 30:
-                    self.selected_channel = channel
-                    return True
+        self.mark_dirty()
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
+        
+        # Check if click is in channel sidebar (rows include both edges: 31px on a 35px pitch)
+        index = stacked_row_at(local_pos, (0, self.titlebar_height + 20), self.sidebar_width + 1, 31, 35,
+                               len(self.channels))
+        if index is not None:
+            self.selected_channel = self.channels[index]
+            return True
         
         # Check reply button (only if there are messages in the selected channel)
         if not self.replying:
-            channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+            channel_messages = self.messages_by_channel.get(self.selected_channel, [])
             if channel_messages:  # Only show reply button if there are messages
-                reply_button_y = self.position[1] + self.height - 80
-                reply_button_rect = pygame.Rect(
-                    self.position[0] + sidebar_width + 10,
-                    reply_button_y,
-                    100,
-                    30
-                )
-                if reply_button_rect.collidepoint(pos):
+                if self._reply_button_rect.collidepoint(local_pos):
                     # Mark reply button as pressed; actual action on release
                     self._reply_button_pressed = True
                     return True
         
         # Check reply option buttons
         if self.replying and self.selected_reply_option is None:
-            reply_options_y = self.position[1] + self.height - 200
-            for i, option in enumerate(self.reply_options):
-                option_rect = pygame.Rect(
-                    self.position[0] + sidebar_width + 10,
-                    reply_options_y + i * 35,
-                    200,
-                    30
-                )
-                if option_rect.collidepoint(pos):
-                    self.selected_reply_option = option
-                    self.target_reply = option
-                    self.reply_text = ""
-                    self.current_letter_index = 0
-                    self.is_reply_complete = False
-                    return True
+            # Options are 30px tall on a 35px pitch, so the row index is plain arithmetic
+            index = stacked_row_at(local_pos, self._options_top_left, 200, 30, 35, len(self.reply_options))
+            if index is not None:
+                option = self.reply_options[index]
+                self.selected_reply_option = option
+                self.target_reply = option
+                self.reply_text = ""
+                self.current_letter_index = 0
+                self.is_reply_complete = False
+                return True
         
         # Check send button
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            msg_x = self.position[0] + sidebar_width + 10
-            send_button_rect = pygame.Rect(
-                msg_x,
-                reply_area_y - 5,  # Below the typing box
-                100,
-                40
-            )
-            if send_button_rect.collidepoint(pos):
+            if self._send_button_rect.collidepoint(local_pos):
                 # Mark send button as pressed; actual send on release
                 self._send_button_pressed = True
                 return True
@@ -1079,22 +1373,16 @@ class SlackWindow(ThemedWindow):
     
     def handle_release(self, pos):
         """Handle mouse release for Slack buttons."""
+        self.mark_dirty()
         super().handle_release(pos)
         
-        content_y = self.position[1] + self.titlebar_height
-        sidebar_width = 180
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
         
         # Reply button release
-        channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+        channel_messages = self.messages_by_channel.get(self.selected_channel, [])
         if not self.replying and channel_messages:
-            reply_button_y = self.position[1] + self.height - 80
-            reply_button_rect = pygame.Rect(
-                self.position[0] + sidebar_width + 10,
-                reply_button_y,
-                100,
-                30
-            )
-            if self._reply_button_pressed and reply_button_rect.collidepoint(pos):
+            if self._reply_button_pressed and self._reply_button_rect.collidepoint(local_pos):
                 self.replying = True
                 self.selected_reply_option = None
                 self.reply_text = ""
@@ -1105,16 +1393,8 @@ class SlackWindow(ThemedWindow):
         
         # Send button release
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            msg_x = self.position[0] + sidebar_width + 10
-            send_button_rect = pygame.Rect(
-                msg_x,
-                reply_area_y - 5,  # Below the typing box
-                100,
-                40
-            )
-            if self._send_button_pressed and send_button_rect.collidepoint(pos):
-                self.messages.append({
+            if self._send_button_pressed and self._send_button_rect.collidepoint(local_pos):
+                self.messages_by_channel.setdefault(self.selected_channel, []).append({
                     "channel": self.selected_channel,
                     "user": "matt",
                     "text": self.reply_text
@@ -1139,8 +1419,10 @@ class SlackWindow(ThemedWindow):
         # Check if we have more letters to type
         if self.current_letter_index < len(self.target_reply):
             # Add next letter
-            self.reply_text += self.target_reply[self.current_letter_index]
             self.current_letter_index += 1
+            self.reply_text = self.target_reply[:self.current_letter_index]
+            # Only the typing box and send button change while typing
+            self.mark_region_dirty()
             
             # Check if complete
             if self.current_letter_index >= len(self.target_reply):
@@ -1148,150 +1430,161 @@ class SlackWindow(ThemedWindow):
             return True
         return False
     
+    def _build_user_panel(self, panel_width):
+        """Draw the right-hand user list for the selected channel onto its own surface"""
+        panel = pygame.Surface((panel_width, max(self.height - self.titlebar_height, 0)))
+        panel.fill((240, 240, 240))
+        
+        # Show users for selected channel
+        users = self.channel_users.get(self.selected_channel, ["calvelli", "matt"])
+        panel.blits([(render_text(14, user, (0, 0, 0)), (10, 20 + i * 30)) for i, user in enumerate(users)],
+                    doreturn=False)
+        return panel
+    
     def render(self, screen):
-        screen.blit(self.background_surface, self.position)
+        self._track_mouse_press()
+        self._render_cached(screen)
+    
+    def _draw_reply_options(self, screen):
+        """Draw the "Select a reply" label and the reply option buttons"""
+        x, y = self._x, self._y
+        reply_area_y = y + self.height - 90
+        msg_x = x + self.sidebar_width + 10
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        label_text = render_text(18, "Select a reply:", (0, 0, 0))
+        screen.blit(label_text, (msg_x, reply_area_y - 150))
+        
+        options_x, options_y = self._options_top_left
+        screen.blit(self._reply_panel, (x + options_x, y + options_y))
+        # Only the option under a held mouse button is redrawn, in its pressed colour
+        if mouse_buttons[0]:
+            pressed = stacked_row_at((mouse_pos[0] - x, mouse_pos[1] - y), self._options_top_left,
+                                     200, 30, 35, len(self.reply_options))
+            if pressed is not None:
+                draw_option_button(screen, self._option_rects[pressed].move(x, y), self.reply_options[pressed],
+                                   16, (220, 220, 220), (200, 200, 200), (0, 0, 0))
+    
+    def _draw_typing_area(self, screen):
+        """Draw the reply typing box and send button (also redrawn alone after a keypress)"""
+        reply_area_y = self._y + self.height - 90
+        msg_x = self._x + self.sidebar_width + 10
+        sidebar_width = self.sidebar_width
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
+        screen.fill((255, 255, 255), typing_box)
+        pygame.draw.rect(screen, (200, 200, 200), typing_box, 1)
+        
+        # Draw typed text
+        typed_text = render_text(16, self.reply_text, (0, 0, 0))
+        screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
+        
+        # Draw remaining text (grayed out)
+        if not self.is_reply_complete:
+            remaining = self.target_reply[self.current_letter_index:]
+            remaining_text = render_text(16, remaining, (200, 200, 200))
+            screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
+        
+        # Draw send button (below the typing box)
+        send_button_rect = self._send_button_rect.move(self._x, self._y)
+        pressed = bool(mouse_buttons[0] and send_button_rect.collidepoint(mouse_pos))
+        screen.blit(self._send_buttons[self.is_reply_complete, pressed], send_button_rect)
+    
+    def _draw_dirty_region(self, screen):
+        self._draw_typing_area(screen)
+        # The user list (and the window border over it) overlaps the right end of the typing box
+        box_y = self.height - 140
+        screen.blit(self._user_panel, (self._x + self.width - 150, self._y + box_y),
+                    pygame.Rect(0, box_y - self.titlebar_height, 150, 40))
+        pygame.draw.rect(screen, (180, 180, 180), 
+                        pygame.Rect(self._x, self._y, self.width, self.height), 2)
+    
+    def _draw_window(self, screen):
+        self._layout_buttons()
+        # Window origin, bound once for the per-row arithmetic below
+        x, y = self._x, self._y
+        screen.blit(self.background_surface, (x, y))
         self.render_titlebar(screen)
         
-        content_y = self.position[1] + self.titlebar_height
+        content_y = y + self.titlebar_height
         
-        # Draw channel sidebar
-        sidebar_width = 180
-        pygame.draw.rect(screen, (60, 60, 60), 
-                        pygame.Rect(self.position[0], content_y, sidebar_width, self.height - self.titlebar_height))
+        # Channel sidebar and channel names come with background_surface
+        sidebar_width = self.sidebar_width
         
-        # Draw channels
-        font = pygame.font.Font(None, 18)
-        for i, channel in enumerate(self.channels):
-            channel_y = content_y + 20 + i * 35
-            if channel == self.selected_channel:
-                pygame.draw.rect(screen, (80, 80, 80), 
-                               pygame.Rect(self.position[0] + 5, channel_y, sidebar_width - 10, 30))
-            
-            channel_text = font.render(channel, True, (200, 200, 200))
+        # Highlight the selected channel and redraw its name on top
+        channel_rect = self._channel_rects.get(self.selected_channel)
+        if channel_rect is not None:
+            screen.fill((80, 80, 80), channel_rect.move(x, y))
             # Slightly closer to the left edge so long names fit
-            screen.blit(channel_text, (self.position[0] + 10, channel_y + 5))
+            screen.blit(render_text(18, self.selected_channel, (200, 200, 200)), (x + 10, y + channel_rect.y + 5))
         
         # Draw message area
-        msg_x = self.position[0] + sidebar_width + 10
+        msg_x = x + sidebar_width + 10
         msg_y = content_y + 10
         msg_area_height = self.height - self.titlebar_height - 100  # Leave space for reply area
         
-        # Fonts (defined here so they're available for user list)
-        font_small = pygame.font.Font(None, 14)
-        font_msg = pygame.font.Font(None, 16)
-        
         # Draw messages for selected channel
-        channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+        channel_messages = self.messages_by_channel.get(self.selected_channel, [])
         
         if channel_messages:
+            msg_area_bottom = content_y + msg_area_height
+            # User names and message text, blitted in one batch
+            text_blits = []
             for i, msg in enumerate(channel_messages):
                 msg_y_pos = msg_y + i * 50
-                if msg_y_pos > content_y + msg_area_height:
+                if msg_y_pos > msg_area_bottom:
                     break  # Don't draw outside message area
                 # User name
-                user_text = font_small.render(msg['user'], True, (100, 100, 200))
-                screen.blit(user_text, (msg_x, msg_y_pos))
+                user_text = render_text(14, msg['user'], (100, 100, 200))
+                text_blits.append((user_text, (msg_x, msg_y_pos)))
                 
                 # Message text
-                text_text = font_msg.render(msg['text'], True, (0, 0, 0))
-                screen.blit(text_text, (msg_x, msg_y_pos + 20))
+                text_text = render_text(16, msg['text'], (0, 0, 0))
+                text_blits.append((text_text, (msg_x, msg_y_pos + 20)))
+            screen.blits(text_blits, doreturn=False)
         else:
             # Show empty state
-            font_empty = pygame.font.Font(None, 24)
-            empty_text = font_empty.render("No messages", True, (150, 150, 150))
-            text_rect = empty_text.get_rect(center=(self.position[0] + self.width // 2, 
-                                                    self.position[1] + self.height // 2))
-            screen.blit(empty_text, text_rect)
+            empty_text = render_text(24, "No messages", (150, 150, 150))
+            blit_centered(screen, empty_text, (x + self.width // 2, y + self.height // 2))
         
         # Draw reply area
-        reply_area_y = self.position[1] + self.height - 90
         # Mouse state for click-feedback on buttons
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos()
         mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
         
-        if self.replying:
-            # Draw reply options if none selected
-            if self.selected_reply_option is None:
-                font_label = pygame.font.Font(None, 18)
-                label_text = font_label.render("Select a reply:", True, (0, 0, 0))
-                screen.blit(label_text, (msg_x, reply_area_y - 150))
-                
-                for i, option in enumerate(self.reply_options):
-                    option_rect = pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
-                    base_color = (240, 240, 240)
-                    if option_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                        draw_color = (220, 220, 220)
-                    else:
-                        draw_color = base_color
-                    pygame.draw.rect(screen, draw_color, option_rect)
-                    pygame.draw.rect(screen, (200, 200, 200), option_rect, 1)
-                    option_text = font_msg.render(option, True, (0, 0, 0))
-                    text_rect = option_text.get_rect(center=option_rect.center)
-                    screen.blit(option_text, text_rect)
-            else:
-                # Draw typing area
-                typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
-                pygame.draw.rect(screen, (255, 255, 255), typing_box)
-                pygame.draw.rect(screen, (200, 200, 200), typing_box, 1)
-                
-                # Draw typed text
-                font_typing = pygame.font.Font(None, 16)
-                typed_text = font_typing.render(self.reply_text, True, (0, 0, 0))
-                screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
-                
-                # Draw remaining text (grayed out)
-                if not self.is_reply_complete:
-                    remaining = self.target_reply[self.current_letter_index:]
-                    remaining_text = font_typing.render(remaining, True, (200, 200, 200))
-                    screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
-                
-                # Draw send button (below the typing box)
-                send_button_rect = pygame.Rect(msg_x, reply_area_y - 5, 100, 40)
-                base_color = (0, 180, 0) if self.is_reply_complete else (150, 150, 150)
-                if send_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                    send_color = tuple(max(0, c - 30) for c in base_color)
-                else:
-                    send_color = base_color
-                pygame.draw.rect(screen, send_color, send_button_rect)
-                pygame.draw.rect(screen, (100, 100, 100), send_button_rect, 1)
-                font_button = pygame.font.Font(None, 16)
-                send_text = font_button.render("Send", True, (255, 255, 255))
-                text_rect = send_text.get_rect(center=send_button_rect.center)
-                screen.blit(send_text, text_rect)
-        else:
+        if not self.replying:
             # Draw reply button (only if there are messages in the selected channel)
-            channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
             if channel_messages:  # Only show reply button if there are messages
                 # Button is below the typing box area (when replying) or below message area
-                reply_button_y = reply_area_y + 10
-                reply_button_rect = pygame.Rect(msg_x, reply_button_y, 100, 30)
+                reply_button_rect = self._reply_button_rect.move(x, y)
                 base_color = (74, 21, 75)  # Slack purple
                 if reply_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
                     draw_color = (60, 15, 65)
                 else:
                     draw_color = base_color
-                pygame.draw.rect(screen, draw_color, reply_button_rect)
+                screen.fill(draw_color, reply_button_rect)
                 pygame.draw.rect(screen, (50, 10, 50), reply_button_rect, 2)  # Border
-                font_button = pygame.font.Font(None, 16)
-                reply_button_text = font_button.render("Reply", True, (255, 255, 255))
-                text_rect = reply_button_text.get_rect(center=reply_button_rect.center)
-                screen.blit(reply_button_text, text_rect)
+                reply_button_text = render_text(16, "Reply", (255, 255, 255))
+                blit_centered(screen, reply_button_text, reply_button_rect.center)
+        elif self.selected_reply_option is None:
+            self._draw_reply_options(screen)
+        else:
+            self._draw_typing_area(screen)
         
         # Draw user list sidebar (right)
         user_sidebar_width = 150
         user_sidebar_x = self.width - user_sidebar_width
-        pygame.draw.rect(screen, (240, 240, 240), 
-                        pygame.Rect(self.position[0] + user_sidebar_x, content_y, 
-                                  user_sidebar_width, self.height - self.titlebar_height))
-        
-        # Show users for selected channel
-        users = self.channel_users.get(self.selected_channel, ["calvelli", "matt"])
-        for i, user in enumerate(users):
-            user_text = font_small.render(user, True, (0, 0, 0))
-            screen.blit(user_text, (self.position[0] + user_sidebar_x + 10, content_y + 20 + i * 30))
+        panel_key = (self.selected_channel, self.height)
+        if panel_key != self._user_panel_key:
+            self._user_panel = self._build_user_panel(user_sidebar_width)
+            self._user_panel_key = panel_key
+        screen.blit(self._user_panel, (x + user_sidebar_x, content_y))
         
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(x, y, self.width, self.height), 2)
 
 
 class DiscordWindow(ThemedWindow):
@@ -1300,9 +1593,20 @@ class DiscordWindow(ThemedWindow):
         super().__init__("Discord", position, width, height, assets_path, z_index)
         self.background_surface.fill((54, 57, 63))  # Discord dark gray
         
+        # Channel sidebar never changes, so it is drawn into the background once
+        self.sidebar_width = 180
+        self.background_surface.fill((32, 34, 37),  # Darker gray
+                        pygame.Rect(0, self.titlebar_height, self.sidebar_width, self.height - self.titlebar_height))
+        
         self.channels = ["# general", "# conference-planning", "# fundraising", "# random"]
-        # Start with empty messages
-        self.messages = []
+        # Channel names sit on the static sidebar too; only the selected row is redrawn over its highlight
+        self.background_surface.blits([(render_text(18, channel, (220, 220, 220)), (10, self.titlebar_height + 25 + i * 35))
+                                       for i, channel in enumerate(self.channels)], doreturn=False)
+        # Highlight row of each channel, relative to the window
+        self._channel_rects = {channel: pygame.Rect(5, self.titlebar_height + 20 + i * 35, self.sidebar_width - 10, 30)
+                               for i, channel in enumerate(self.channels)}
+        # Start with empty messages, kept in one list per channel
+        self.messages_by_channel = {channel: [] for channel in self.channels}
         self.selected_channel = "# general"
         
         # Reply state
@@ -1312,77 +1616,87 @@ class DiscordWindow(ThemedWindow):
         self.current_letter_index = 0
         self.is_reply_complete = False
         self.reply_options = ["Okay", "Got it", "Thanks", "Will do", "Sure thing"]
+        # The options never change, so their buttons are drawn once and blitted as a single panel
+        self._reply_panel = build_option_panel(self.reply_options, 200, 30, 35, 16, (47, 49, 54), (66, 70, 78), (220, 220, 220))
         self.selected_reply_option = None
+        # Send button in each (reply complete, pressed) state, drawn once and picked per draw
+        self._send_buttons = {
+            (complete, pressed): build_button("Send", 100, 40, 16, darken(base_color, 25) if pressed else base_color,
+                                              (100, 100, 100), (255, 255, 255))
+            for complete, base_color in ((True, (88, 101, 242)), (False, (66, 70, 78)))
+            for pressed in (False, True)
+        }
+        # Reply/option/send button rects relative to the window, laid out for this window size
+        self._button_layout_size = None
         # Events to report back to the game (for small progress updates)
         self.sent_reply_events = []
         # Track pressed state for Discord reply/send buttons
         self._reply_button_pressed = False
         self._send_button_pressed = False
     
+    def _layout_buttons(self):
+        """Compute the reply, option and send button rects relative to the window's top-left corner
+        
+        Only recomputed when the window size changes (the startup animation resizes windows).
+        """
+        size = (self.width, self.height)
+        if size == self._button_layout_size:
+            return
+        reply_area_y = self.height - 90
+        msg_x = self.sidebar_width + 10
+        self._reply_button_rect = pygame.Rect(msg_x, reply_area_y, 100, 30)
+        self._options_top_left = (msg_x, reply_area_y - 130)
+        self._option_rects = [pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
+                              for i in range(len(self.reply_options))]
+        self._send_button_rect = pygame.Rect(self.width - 110, reply_area_y - 50, 100, 40)
+        self._button_layout_size = size
+    
     def add_message(self, channel, user, text):
         """Add a message to a channel"""
-        self.messages.append({"channel": channel, "user": user, "text": text})
+        self.mark_dirty()
+        self.messages_by_channel.setdefault(channel, []).append({"channel": channel, "user": user, "text": text})
         # Auto-select the channel if it's not already selected
         if self.selected_channel != channel:
             self.selected_channel = channel
     
     def _handle_content_click(self, pos):
         """Handle clicks on channels and reply button"""
-        content_y = self.position[1] + self.titlebar_height
-        
-        # Check if click is in channel sidebar
-        sidebar_width = 180
-        if self.position[0] <= pos[0] <= self.position[0] + sidebar_width:
-            for i, channel in enumerate(self.channels):
-                channel_y = content_y + 20 + i * 35
-                if channel_y <= pos[1] <= channel_y + 30:
-                    self.selected_channel = channel
-                    return True
+        self.mark_dirty()
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
+        
+        # Check if click is in channel sidebar (rows include both edges: 31px on a 35px pitch)
+        index = stacked_row_at(local_pos, (0, self.titlebar_height + 20), self.sidebar_width + 1, 31, 35,
+                               len(self.channels))
+        if index is not None:
+            self.selected_channel = self.channels[index]
+            return True
         
         # Check reply button (only if there are messages in the selected channel)
         if not self.replying:
-            channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+            channel_messages = self.messages_by_channel.get(self.selected_channel, [])
             if channel_messages:  # Only show reply button if there are messages
-                reply_button_y = self.position[1] + self.height - 80
-                reply_button_rect = pygame.Rect(
-                    self.position[0] + sidebar_width + 10,
-                    reply_button_y,
-                    100,
-                    30
-                )
-                if reply_button_rect.collidepoint(pos):
+                if self._reply_button_rect.collidepoint(local_pos):
                     # Mark reply button as pressed; actual action on release
                     self._reply_button_pressed = True
                     return True
         
         # Check reply option buttons
         if self.replying and self.selected_reply_option is None:
-            reply_options_y = self.position[1] + self.height - 200
-            for i, option in enumerate(self.reply_options):
-                option_rect = pygame.Rect(
-                    self.position[0] + sidebar_width + 10,
-                    reply_options_y + i * 35,
-                    200,
-                    30
-                )
-                if option_rect.collidepoint(pos):
-                    self.selected_reply_option = option
-                    self.target_reply = option
-                    self.reply_text = ""
-                    self.current_letter_index = 0
-                    self.is_reply_complete = False
-                    return True
+            # Options are 30px tall on a 35px pitch, so the row index is plain arithmetic
+            index = stacked_row_at(local_pos, self._options_top_left, 200, 30, 35, len(self.reply_options))
+            if index is not None:
+                option = self.reply_options[index]
+                self.selected_reply_option = option
+                self.target_reply = option
+                self.reply_text = ""
+                self.current_letter_index = 0
+                self.is_reply_complete = False
+                return True
         
         # Check send button
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            send_button_rect = pygame.Rect(
-                self.position[0] + self.width - 110,  # Match render position
-                reply_area_y - 50,  # Match render position
-                100,
-                40
-            )
-            if send_button_rect.collidepoint(pos):
+            if self._send_button_rect.collidepoint(local_pos):
                 # Mark send button as pressed; actual send on release
                 self._send_button_pressed = True
                 return True
@@ -1391,22 +1705,16 @@ class DiscordWindow(ThemedWindow):
     
     def handle_release(self, pos):
         """Handle mouse release for Discord buttons."""
+        self.mark_dirty()
         super().handle_release(pos)
         
-        content_y = self.position[1] + self.titlebar_height
-        sidebar_width = 180
+        self._layout_buttons()
+        local_pos = (pos[0] - self._x, pos[1] - self._y)
         
         # Reply button release
-        channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+        channel_messages = self.messages_by_channel.get(self.selected_channel, [])
         if not self.replying and channel_messages:
-            reply_button_y = self.position[1] + self.height - 80
-            reply_button_rect = pygame.Rect(
-                self.position[0] + sidebar_width + 10,
-                reply_button_y,
-                100,
-                30
-            )
-            if self._reply_button_pressed and reply_button_rect.collidepoint(pos):
+            if self._reply_button_pressed and self._reply_button_rect.collidepoint(local_pos):
                 self.replying = True
                 self.selected_reply_option = None
                 self.reply_text = ""
@@ -1417,15 +1725,8 @@ class DiscordWindow(ThemedWindow):
         
         # Send button release
         if self.replying and self.is_reply_complete:
-            reply_area_y = self.position[1] + self.height - 90
-            send_button_rect = pygame.Rect(
-                self.position[0] + self.width - 110,  # Match render position
-                reply_area_y - 50,  # Match render position
-                100,
-                40
-            )
-            if self._send_button_pressed and send_button_rect.collidepoint(pos):
-                self.messages.append({
+            if self._send_button_pressed and self._send_button_rect.collidepoint(local_pos):
+                self.messages_by_channel.setdefault(self.selected_channel, []).append({
                     "channel": self.selected_channel,
                     "user": "matt",
                     "text": self.reply_text
@@ -1450,8 +1751,10 @@ class DiscordWindow(ThemedWindow):
         # Check if we have more letters to type
         if self.current_letter_index < len(self.target_reply):
             # Add next letter
-            self.reply_text += self.target_reply[self.current_letter_index]
             self.current_letter_index += 1
+            self.reply_text = self.target_reply[:self.current_letter_index]
+            # Only the typing box and send button change while typing
+            self.mark_region_dirty()
             
             # Check if complete
             if self.current_letter_index >= len(self.target_reply):
@@ -1460,128 +1763,128 @@ class DiscordWindow(ThemedWindow):
         return False
     
     def render(self, screen):
-        screen.blit(self.background_surface, self.position)
+        self._track_mouse_press()
+        self._render_cached(screen)
+    
+    def _draw_reply_options(self, screen):
+        """Draw the "Select a reply" label and the reply option buttons"""
+        x, y = self._x, self._y
+        reply_area_y = y + self.height - 90
+        msg_x = x + self.sidebar_width + 10
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        label_text = render_text(18, "Select a reply:", (220, 220, 220))
+        screen.blit(label_text, (msg_x, reply_area_y - 150))
+        
+        options_x, options_y = self._options_top_left
+        screen.blit(self._reply_panel, (x + options_x, y + options_y))
+        # Only the option under a held mouse button is redrawn, in its pressed colour
+        if mouse_buttons[0]:
+            pressed = stacked_row_at((mouse_pos[0] - x, mouse_pos[1] - y), self._options_top_left,
+                                     200, 30, 35, len(self.reply_options))
+            if pressed is not None:
+                draw_option_button(screen, self._option_rects[pressed].move(x, y), self.reply_options[pressed],
+                                   16, (37, 39, 44), (66, 70, 78), (220, 220, 220))
+    
+    def _draw_typing_area(self, screen):
+        """Draw the reply typing box and send button (also redrawn alone after a keypress)"""
+        reply_area_y = self._y + self.height - 90
+        msg_x = self._x + self.sidebar_width + 10
+        sidebar_width = self.sidebar_width
+        mouse_pos = self._mouse_pos()
+        mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
+        
+        typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
+        screen.fill((66, 70, 78), typing_box)
+        pygame.draw.rect(screen, (88, 101, 242), typing_box, 1)
+        
+        # Draw typed text
+        typed_text = render_text(16, self.reply_text, (220, 220, 220))
+        screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
+        
+        # Draw remaining text (grayed out)
+        if not self.is_reply_complete:
+            remaining = self.target_reply[self.current_letter_index:]
+            remaining_text = render_text(16, remaining, (150, 150, 150))
+            screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
+        
+        # Draw send button with press feedback
+        send_button_rect = self._send_button_rect.move(self._x, self._y)
+        pressed = bool(mouse_buttons[0] and send_button_rect.collidepoint(mouse_pos))
+        screen.blit(self._send_buttons[self.is_reply_complete, pressed], send_button_rect)
+    
+    def _draw_dirty_region(self, screen):
+        self._draw_typing_area(screen)
+    
+    def _draw_window(self, screen):
+        self._layout_buttons()
+        # Window origin, bound once for the per-row arithmetic below
+        x, y = self._x, self._y
+        screen.blit(self.background_surface, (x, y))
         self.render_titlebar(screen)
         
-        content_y = self.position[1] + self.titlebar_height
+        content_y = y + self.titlebar_height
         
-        # Draw channel sidebar
-        sidebar_width = 180
-        pygame.draw.rect(screen, (32, 34, 37),  # Darker gray
-                        pygame.Rect(self.position[0], content_y, sidebar_width, self.height - self.titlebar_height))
+        # Channel sidebar and channel names come with background_surface
+        sidebar_width = self.sidebar_width
         
-        # Draw channels
-        font = pygame.font.Font(None, 18)
-        for i, channel in enumerate(self.channels):
-            channel_y = content_y + 20 + i * 35
-            if channel == self.selected_channel:
-                pygame.draw.rect(screen, (47, 49, 54), 
-                               pygame.Rect(self.position[0] + 5, channel_y, sidebar_width - 10, 30))
-            
-            channel_text = font.render(channel, True, (220, 220, 220))
+        # Highlight the selected channel and redraw its name on top
+        channel_rect = self._channel_rects.get(self.selected_channel)
+        if channel_rect is not None:
+            screen.fill((47, 49, 54), channel_rect.move(x, y))
             # Slightly closer to the left edge so long names fit
-            screen.blit(channel_text, (self.position[0] + 10, channel_y + 5))
+            screen.blit(render_text(18, self.selected_channel, (220, 220, 220)), (x + 10, y + channel_rect.y + 5))
         
         # Draw message area
-        msg_x = self.position[0] + sidebar_width + 10
+        msg_x = x + sidebar_width + 10
         msg_y = content_y + 10
         msg_area_height = self.height - self.titlebar_height - 100  # Leave space for reply area
         
-        # Fonts
-        font_small = pygame.font.Font(None, 14)
-        font_msg = pygame.font.Font(None, 16)
-        
         # Draw messages for selected channel
-        channel_messages = [m for m in self.messages if m['channel'] == self.selected_channel]
+        channel_messages = self.messages_by_channel.get(self.selected_channel, [])
         
         if channel_messages:
+            msg_area_bottom = content_y + msg_area_height
+            # User names and message text, blitted in one batch
+            text_blits = []
             for i, msg in enumerate(channel_messages):
                 msg_y_pos = msg_y + i * 50
-                if msg_y_pos > content_y + msg_area_height:
+                if msg_y_pos > msg_area_bottom:
                     break  # Don't draw outside message area
                 # User name
-                user_text = font_small.render(msg['user'], True, (88, 101, 242))  # Discord blurple
-                screen.blit(user_text, (msg_x, msg_y_pos))
+                user_text = render_text(14, msg['user'], (88, 101, 242))  # Discord blurple
+                text_blits.append((user_text, (msg_x, msg_y_pos)))
                 
                 # Message text
-                text_text = font_msg.render(msg['text'], True, (220, 220, 220))
-                screen.blit(text_text, (msg_x, msg_y_pos + 20))
+                text_text = render_text(16, msg['text'], (220, 220, 220))
+                text_blits.append((text_text, (msg_x, msg_y_pos + 20)))
+            screen.blits(text_blits, doreturn=False)
         else:
             # Show empty state
-            font_empty = pygame.font.Font(None, 24)
-            empty_text = font_empty.render("No messages", True, (150, 150, 150))
-            text_rect = empty_text.get_rect(center=(self.position[0] + self.width // 2, 
-                                                    self.position[1] + self.height // 2))
-            screen.blit(empty_text, text_rect)
+            empty_text = render_text(24, "No messages", (150, 150, 150))
+            blit_centered(screen, empty_text, (x + self.width // 2, y + self.height // 2))
         
         # Draw reply area
-        reply_area_y = self.position[1] + self.height - 90
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos()
         mouse_buttons = pygame.mouse.get_pressed(num_buttons=3)
         
-        if self.replying:
-            # Draw reply options if none selected
-            if self.selected_reply_option is None:
-                font_label = pygame.font.Font(None, 18)
-                label_text = font_label.render("Select a reply:", True, (220, 220, 220))
-                screen.blit(label_text, (msg_x, reply_area_y - 150))
-                
-                for i, option in enumerate(self.reply_options):
-                    option_rect = pygame.Rect(msg_x, reply_area_y - 130 + i * 35, 200, 30)
-                    base_color = (47, 49, 54)
-                    if option_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                        draw_color = (37, 39, 44)
-                    else:
-                        draw_color = base_color
-                    pygame.draw.rect(screen, draw_color, option_rect)
-                    pygame.draw.rect(screen, (66, 70, 78), option_rect, 1)
-                    option_text = font_msg.render(option, True, (220, 220, 220))
-                    text_rect = option_text.get_rect(center=option_rect.center)
-                    screen.blit(option_text, text_rect)
-            else:
-                # Draw typing area
-                typing_box = pygame.Rect(msg_x, reply_area_y - 50, self.width - sidebar_width - 120, 40)
-                pygame.draw.rect(screen, (66, 70, 78), typing_box)
-                pygame.draw.rect(screen, (88, 101, 242), typing_box, 1)
-                
-                # Draw typed text
-                font_typing = pygame.font.Font(None, 16)
-                typed_text = font_typing.render(self.reply_text, True, (220, 220, 220))
-                screen.blit(typed_text, (msg_x + 5, reply_area_y - 45))
-                
-                # Draw remaining text (grayed out)
-                if not self.is_reply_complete:
-                    remaining = self.target_reply[self.current_letter_index:]
-                    remaining_text = font_typing.render(remaining, True, (150, 150, 150))
-                    screen.blit(remaining_text, (msg_x + 5 + typed_text.get_width(), reply_area_y - 45))
-                
-                # Draw send button with press feedback
-                send_button_rect = pygame.Rect(self.position[0] + self.width - 110, reply_area_y - 50, 100, 40)
-                base_color = (88, 101, 242) if self.is_reply_complete else (66, 70, 78)
-                if send_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
-                    send_color = tuple(max(0, c - 25) for c in base_color)
-                else:
-                    send_color = base_color
-                pygame.draw.rect(screen, send_color, send_button_rect)
-                pygame.draw.rect(screen, (100, 100, 100), send_button_rect, 1)
-                font_button = pygame.font.Font(None, 16)
-                send_text = font_button.render("Send", True, (255, 255, 255))
-                text_rect = send_text.get_rect(center=send_button_rect.center)
-                screen.blit(send_text, text_rect)
-        else:
+        if not self.replying:
             # Draw reply button (only if there are messages in the selected channel)
             if channel_messages:  # Only show reply button if there are messages
-                reply_button_rect = pygame.Rect(msg_x, reply_area_y, 100, 30)
+                reply_button_rect = self._reply_button_rect.move(x, y)
                 base_color = (88, 101, 242)  # Discord blurple
                 if reply_button_rect.collidepoint(mouse_pos) and mouse_buttons[0]:
                     draw_color = (70, 80, 210)
                 else:
                     draw_color = base_color
-                pygame.draw.rect(screen, draw_color, reply_button_rect)
-                font_button = pygame.font.Font(None, 16)
-                reply_text = font_button.render("Reply", True, (255, 255, 255))
-                text_rect = reply_text.get_rect(center=reply_button_rect.center)
-                screen.blit(reply_text, text_rect)
+                screen.fill(draw_color, reply_button_rect)
+                reply_text = render_text(16, "Reply", (255, 255, 255))
+                blit_centered(screen, reply_text, reply_button_rect.center)
+        elif self.selected_reply_option is None:
+            self._draw_reply_options(screen)
+        else:
+            self._draw_typing_area(screen)
         
         pygame.draw.rect(screen, (180, 180, 180), 
-                        pygame.Rect(self.position[0], self.position[1], self.width, self.height), 2)
+                        pygame.Rect(x, y, self.width, self.height), 2)